@@ -0,0 +1,106 @@
+# STDLIB
+from collections import OrderedDict
+import time
+from typing import Any, Hashable, Optional, Protocol
+
+
+class CacheBackend(Protocol):
+    """
+    Интерфейс хранилища кеша. TTLCache - реализация по умолчанию, другое хранилище
+    (например, общее для воркеров) должно предоставлять те же методы.
+    """
+
+    def get(self, key: Hashable, default: Any = None) -> Any: ...
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None: ...
+
+    def delete(self, key: Hashable) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class TTLCache:
+    """
+    Ограниченный по размеру LRU кеш, записи которого живут не дольше ttl секунд.
+
+    Используется внутри одного процесса (воркера), поэтому не потокобезопасен
+    и рассчитан на работу из event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Отдаёт значение по ключу и помечает его как недавно использованное.
+
+        Args:
+            key: Ключ записи.
+            default: Значение, которое вернётся, если записи нет или она устарела.
+
+        Returns:
+            Сохранённое значение или default.
+        """
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Сохраняет значение, вытесняя самые давно использованные записи.
+
+        Args:
+            key: Ключ записи.
+            value: Сохраняемое значение.
+            ttl: Время жизни записи в секундах, не больше ttl кеша (по умолчанию - ttl кеша).
+        """
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Удаляет запись по ключу, если она есть."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+        self._data.clear()
+
+    def stats(self) -> dict:
+        """
+        Отдаёт статистику работы кеша.
+
+        Returns:
+            Словарь с числом попаданий и промахов, текущим и максимальным размером.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
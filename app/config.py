@@ -1,5 +1,6 @@
 # STDLIB
 import os
+from typing import List, Literal
 
 # THIRDPARTY
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,9 +13,66 @@ class Settings(BaseSettings):
     DB_PASS: str
     DB_NAME: str
 
+    DB_POOL_CLASS: Literal["queue", "null"] = "queue"
+    DB_POOL_SIZE: int = 10
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_TIMEOUT: float = 30
+    DB_QUERY_CACHE_SIZE: int = 500
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    DAO_STATEMENT_CACHE_SIZE: int = 500
+
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_HEALTHCHECK_INTERVAL: float = 5
+    DB_REPLICA_HEALTHCHECK_TIMEOUT: float = 2
+    DB_READ_YOUR_WRITES_WINDOW: float = 5
+    DB_READ_YOUR_WRITES_CACHE_SIZE: int = 10000
+
     SECRET_KEY: str
     ALGORITHM: str
 
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: float = 60
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL: float = 3600
+
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    FAST_JSON_RESPONSES: bool = False
+
+    MONITORING_TOKEN: str = ""
+
+    PROFILING_ENABLED: bool = False
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_TOKEN: str = ""
+    PROFILING_SAMPLE_RATE: float = 0
+    PROFILING_INTERVAL: float = 0.005
+    PROFILING_MAX_CONCURRENT: int = 2
+    PROFILING_DIR: str = "profiles"
+    PROFILING_DIR_MAX_BYTES: int = 50 * 1024 * 1024
+
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_QUEUE_POLICY: Literal["drop", "block"] = "drop"
+    LOG_SAMPLE_RATE: float = 1
+    LOG_SAMPLED_MESSAGES: List[str] = ["Request handling time"]
+
+    TASKS_RESPONSE_CACHE_SIZE: int = 10000
+    TASKS_RESPONSE_CACHE_TTL: float = 60
+
+    CACHE_INVALIDATION_BUS: bool = True
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+    CACHE_INVALIDATION_FALLBACK_TTL: float = 5
+    CACHE_INVALIDATION_RECONNECT_DELAY: float = 1
+    CACHE_INVALIDATION_HEALTHCHECK_INTERVAL: float = 10
+
+    TASKS_EXPORT_CHUNK_SIZE: int = 1000
+    TASKS_IMPORT_BATCH_SIZE: int = 5000
+    TASKS_IMPORT_TIMEOUT: float = 30
+
     model_config = SettingsConfigDict(
         env_file=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".env")
     )
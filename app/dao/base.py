@@ -1,51 +1,247 @@
+# STDLIB
+from typing import Callable, Iterable, Sequence
+
 # THIRDPARTY
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+# FIRSTPARTY
+from app.cache import TTLCache
+from app.config import settings
+from app.invalidation import publish_invalidation
+
+# Запросы DAO, построенные по сигнатуре вызова. Запросы не устаревают, поэтому ttl не ограничен.
+statement_cache = TTLCache(maxsize=settings.DAO_STATEMENT_CACHE_SIZE, ttl=float("inf"))
 
 
 class BaseDao:
     model = None
+    # Поле записи с ID владельца, по которому сбрасываются кеши после изменений.
+    owner_field = "uuid"
+
+    @classmethod
+    def publish_changes(cls, session: AsyncSession, owner_ids: Iterable) -> None:
+        """
+        Отмечает изменение записей владельцев owner_ids для шины сброса кешей.
+
+        Args:
+            session: Асинхронная сессия, в которой изменяются записи.
+            owner_ids: ID владельцев изменённых записей.
+        """
+        for owner_id in owner_ids:
+            publish_invalidation(session, cls.model.__tablename__, owner_id)
+
+    @classmethod
+    def _statement(cls, operation: str, keys: tuple, build: Callable):
+        """
+        Отдаёт запрос из кеша запросов DAO, строя его при первом вызове.
+
+        Запросы строятся с bindparam вместо значений, поэтому один объект запроса
+        переиспользуется для всех вызовов с той же сигнатурой (модель, операция, поля).
+        У переиспользуемого запроса SQLAlchemy запоминает ключ кеша компиляции
+        и не строит его заново при каждом выполнении.
+
+        Args:
+            operation: Имя операции DAO.
+            keys: Имена полей, от которых зависит текст запроса.
+            build: Функция, строящая запрос.
+
+        Returns:
+            Объект запроса.
+        """
+        cache_key = (cls.model, operation, keys)
+        statement = statement_cache.get(cache_key)
+        if statement is None:
+            statement = build()
+            statement_cache.set(cache_key, statement)
+        return statement
+
+    @classmethod
+    def _filter_statement(
+        cls, operation: str, statement_factory: Callable, values: dict
+    ):
+        """
+        Отдаёт запрос с условиями равенства по полям values.
+
+        Поля со значением None сравниваются через IS NULL, а не через "= NULL",
+        которое не выполняется ни для одной записи. Набор таких полей входит
+        в ключ кеша, поэтому для них строится отдельный запрос.
+
+        Args:
+            operation: Имя операции DAO.
+            statement_factory: Функция, строящая запрос без условий.
+            values: Значения полей, по которым фильтруются записи.
+
+        Returns:
+            Объект запроса.
+        """
+        keys = tuple(sorted(values))
+        null_keys = tuple(key for key in keys if values[key] is None)
+        return cls._statement(
+            operation,
+            (keys, null_keys),
+            lambda: statement_factory().where(
+                *(
+                    getattr(cls.model, key).is_(None)
+                    if key in null_keys
+                    else getattr(cls.model, key) == bindparam(f"filter_{key}")
+                    for key in keys
+                )
+            ),
+        )
+
+    @staticmethod
+    def _filter_params(values: dict) -> dict:
+        return {
+            f"filter_{key}": value for key, value in values.items() if value is not None
+        }
 
     @classmethod
     async def add(cls, session: AsyncSession, **values):
-        query = insert(cls.model).values(**values).returning(cls.model)
-        result = await session.execute(query)
-        return result.scalar()
+        added = await cls.add_many(session=session, values=[values])
+        return added[0]
+
+    @classmethod
+    async def add_many(cls, session: AsyncSession, values: list[dict]):
+        if not values:
+            return []
+
+        query = cls._statement(
+            "add_many",
+            (),
+            lambda: insert(cls.model).returning(
+                cls.model, sort_by_parameter_order=True
+            ),
+        )
+        result = await session.execute(query, values)
+        added = result.scalars().all()
+        cls.publish_changes(session, {getattr(row, cls.owner_field) for row in added})
+        return added
 
     @classmethod
     async def find_by_id(cls, session: AsyncSession, model_id):
-        query = select(cls.model).filter_by(uuid=model_id)
-        result = await session.execute(query)
+        values = {"uuid": model_id}
+        query = cls._filter_statement("find", lambda: select(cls.model), values)
+        result = await session.execute(query, cls._filter_params(values))
         return result.scalar_one_or_none()
 
     @classmethod
     async def find_all(cls, session: AsyncSession, **values):
-        query = select(cls.model).filter_by(**values)
-        result = await session.execute(query)
+        query = cls._filter_statement("find", lambda: select(cls.model), values)
+        result = await session.execute(query, cls._filter_params(values))
         return result.scalars().all()
 
     @classmethod
     async def find_one_or_none(cls, session: AsyncSession, **values):
-        query = select(cls.model).filter_by(**values)
-        result = await session.execute(query)
+        query = cls._filter_statement("find", lambda: select(cls.model), values)
+        result = await session.execute(query, cls._filter_params(values))
         return result.scalar_one_or_none()
 
     @classmethod
     async def delete(cls, session: AsyncSession, **values):
-        query = delete(cls.model).filter_by(**values)
-        await session.execute(query)
+        query = cls._filter_statement(
+            "delete",
+            lambda: delete(cls.model).returning(getattr(cls.model, cls.owner_field)),
+            values,
+        )
+        result = await session.execute(query, cls._filter_params(values))
+        cls.publish_changes(session, set(result.scalars()))
 
     @classmethod
     async def update(cls, session: AsyncSession, model_id, **values):
+        keys = tuple(sorted(values))
+        query = cls._statement(
+            "update",
+            keys,
+            lambda: (
+                update(cls.model)
+                .where(cls.model.uuid == bindparam("filter_uuid"))
+                .values({key: bindparam(f"value_{key}") for key in keys})
+                .returning(cls.model)
+                .execution_options(populate_existing=True)
+            ),
+        )
+        params = {f"value_{key}": value for key, value in values.items()}
+        result = await session.execute(query, {"filter_uuid": model_id, **params})
+        updated = result.scalar()
+        if updated is not None:
+            cls.publish_changes(session, [getattr(updated, cls.owner_field)])
+
+        return updated
+
+    @classmethod
+    async def conditional_update(
+        cls,
+        session: AsyncSession,
+        filters: dict,
+        conditions: Sequence = (),
+        **values,
+    ):
+        """
+        Обновляет запись одним запросом, если она подходит под filters и conditions.
+
+        Args:
+            session: Асинхронная сессия базы данных.
+            filters: Условия, по которым ищется запись (например, uuid и владелец).
+            conditions: Дополнительные условия, при которых запись можно обновить.
+            values: Новые значения полей.
+
+        Returns:
+            (updated, found): Обновлённая запись (None, если conditions не выполнены)
+            и признак того, что запись с filters существует.
+        """
         query = (
             update(cls.model)
-            .where(cls.model.uuid == model_id)
+            .where(*cls._filters_clauses(filters), *conditions)
             .values(**values)
-            .returning(cls.model)
         )
-        result = await session.execute(query)
+        return await cls._execute_conditional(session, query, filters)
+
+    @classmethod
+    async def conditional_delete(
+        cls, session: AsyncSession, filters: dict, conditions: Sequence = ()
+    ):
+        """
+        Удаляет запись одним запросом, если она подходит под filters и conditions.
+
+        Args:
+            session: Асинхронная сессия базы данных.
+            filters: Условия, по которым ищется запись (например, uuid и владелец).
+            conditions: Дополнительные условия, при которых запись можно удалить.
+
+        Returns:
+            (deleted, found): Удалённая запись (None, если conditions не выполнены)
+            и признак того, что запись с filters существует.
+        """
+        query = delete(cls.model).where(*cls._filters_clauses(filters), *conditions)
+        return await cls._execute_conditional(session, query, filters)
+
+    @classmethod
+    def _filters_clauses(cls, filters: dict) -> list:
+        return [getattr(cls.model, key) == value for key, value in filters.items()]
+
+    @classmethod
+    async def _execute_conditional(cls, session: AsyncSession, query, filters: dict):
+        written = query.returning(*cls.model.__table__.columns).cte("written")
+        written_model = aliased(cls.model, written)
+
+        found_query = (
+            select(cls.model.uuid, written_model)
+            .outerjoin(written, written.c.uuid == cls.model.uuid)
+            .where(*cls._filters_clauses(filters))
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(found_query)
+        row = result.first()
+        if row is None:
+            return None, False
+
+        written_row = row[1]
+        if written_row is not None:
+            cls.publish_changes(session, [getattr(written_row, cls.owner_field)])
 
-        return result.scalar()
+        return written_row, True
 
 
 # pyright: reportArgumentType=false
@@ -1,50 +1,287 @@
 # STDLIB
-from typing import Annotated, AsyncGenerator
+import time
+from typing import Annotated, AsyncGenerator, Callable
 
 # THIRDPARTY
-from fastapi import Depends
-from sqlalchemy import NullPool, text
+from fastapi import Depends, Request
+from sqlalchemy import AsyncAdaptedQueuePool, NullPool, event, text
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.util import LRUCache
 
 # FIRSTPARTY
-from app.config import get_db_url
+from app.config import get_db_url, settings
+from app.invalidation import invalidation_bus
 from app.logger import logger
+from app.monitoring.metrics import query_duration, sql_operation
+from app.replicas import REPLICA_READ_METHODS, ReplicaSet, get_request_user_id
 
 DATABASE_URL = get_db_url()
 
-engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
 
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время получения соединения из пула."""
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def connect(self):
+        start_time = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            wait_time = time.perf_counter() - start_time
+            self.checkouts += 1
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+
+class MeteredLRUCache(LRUCache):
+    """
+    Кеш подготовленных запросов asyncpg одного соединения, считающий попадания.
+
+    Заменяет кеш, который создаёт диалект asyncpg SQLAlchemy, поэтому считаются
+    именно запросы, для которых не понадобился повторный PREPARE на сервере.
+    """
+
+    def __contains__(self, key):
+        found = super().__contains__(key)
+        prepared_statement_cache_stats["hits" if found else "misses"] += 1
+        return found
+
+
+compiled_cache_stats = {"hits": 0, "misses": 0}
+prepared_statement_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _meter_prepared_statement_cache(dbapi_connection, _) -> None:
+    if settings.DB_PREPARED_STATEMENT_CACHE_SIZE <= 0:
+        return
+    # _prepared_statement_cache - внутренний атрибут соединения диалекта asyncpg
+    # SQLAlchemy. Если после обновления SQLAlchemy его нет, подмена молча ничего
+    # бы не считала, поэтому соединение не создаётся, пока код не исправлен.
+    if not hasattr(dbapi_connection, "_prepared_statement_cache"):
+        raise RuntimeError(
+            "asyncpg connection has no _prepared_statement_cache, "
+            "update MeteredLRUCache for the installed SQLAlchemy version"
+        )
+    dbapi_connection._prepared_statement_cache = MeteredLRUCache(
+        settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    )
+
+
+def _count_compiled_cache(_conn, _cursor, _statement, _params, context, _many) -> None:
+    if context is None:
+        return
+    if context.cache_hit == CacheStats.CACHE_HIT:
+        compiled_cache_stats["hits"] += 1
+    elif context.cache_hit in (CacheStats.CACHE_MISS, CacheStats.NO_CACHE_KEY):
+        compiled_cache_stats["misses"] += 1
+
+
+def _start_query_timer(conn, _cursor, _statement, _params, _context, _many) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _discard_query_timer(context) -> None:
+    if context.connection is not None and context.cursor is not None:
+        start_times = context.connection.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
+
+
+def _observe_query_duration(database: str) -> Callable:
+    def observe(conn, _cursor, statement, _params, _context, _many) -> None:
+        query_duration.observe(
+            time.perf_counter() - conn.info["query_start_time"].pop(),
+            database=database,
+            operation=sql_operation(statement),
+        )
+
+    return observe
+
+
+def create_engine(
+    url: str = DATABASE_URL, database: str = "primary", **options
+) -> AsyncEngine:
+    """
+    Создаёт движок базы данных с настройками пула из Settings.
+
+    Время выполнения запросов движка попадает в гистограмму db_query_duration_seconds
+    с меткой database.
+
+    Args:
+        url: Ссылка для подключения к базе данных (по умолчанию - основная база).
+        database: Роль базы данных для метрик (primary или replica).
+        **options: Дополнительные параметры create_async_engine.
+
+    Returns:
+        AsyncEngine: Асинхронный движок SQLAlchemy.
+    """
+    options.update(
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+        },
+    )
+
+    if settings.DB_POOL_CLASS == "null":
+        new_engine = create_async_engine(url, poolclass=NullPool, **options)
+    else:
+        new_engine = create_async_engine(
+            url,
+            **options,
+            poolclass=MeteredQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+
+    event.listen(new_engine.sync_engine, "connect", _meter_prepared_statement_cache)
+    event.listen(new_engine.sync_engine, "after_cursor_execute", _count_compiled_cache)
+    event.listen(new_engine.sync_engine, "before_cursor_execute", _start_query_timer)
+    event.listen(
+        new_engine.sync_engine,
+        "after_cursor_execute",
+        _observe_query_duration(database),
+    )
+    event.listen(new_engine.sync_engine, "handle_error", _discard_query_timer)
+    return new_engine
+
+
+engine = create_engine()
+
+replicas = ReplicaSet(
+    [
+        create_engine(url, database="replica", isolation_level="AUTOCOMMIT")
+        for url in settings.DB_REPLICA_URLS
+    ]
+)
+invalidation_bus.register("users", invalidate=replicas.mark_write, clear=lambda: None)
+invalidation_bus.register("tasks", invalidate=replicas.mark_write, clear=lambda: None)
+
+
+def get_statement_cache_stats() -> dict:
+    """
+    Отдаёт статистику кешей запросов SQLAlchemy и asyncpg.
+
+    Returns:
+        Словарь с попаданиями и промахами кеша компиляции SQLAlchemy (compiled)
+        и кеша подготовленных запросов asyncpg (prepared), а также их размерами из Settings.
+    """
+    return {
+        "compiled": {**compiled_cache_stats, "maxsize": settings.DB_QUERY_CACHE_SIZE},
+        "prepared": {
+            **prepared_statement_cache_stats,
+            "maxsize": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
+def get_pool_stats() -> dict:
+    """
+    Отдаёт текущую статистику пула соединений.
+
+    Returns:
+        Словарь с размером пула, числом занятых и свободных соединений,
+        текущим переполнением и временем ожидания соединения.
+    """
+    pool = engine.pool
+    if not isinstance(pool, MeteredQueuePool):
+        return {"pool_class": type(pool).__name__}
+
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "checkouts": pool.checkouts,
+        "wait_time_total": pool.wait_time_total,
+        "wait_time_max": pool.wait_time_max,
+    }
+
+
+SessionLocal = async_sessionmaker(
+    bind=engine, class_=AsyncSession, expire_on_commit=False
+)
+
+read_only_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+ReadOnlySessionLocal = async_sessionmaker(
+    bind=read_only_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
+def read_only(endpoint: Callable) -> Callable:
+    """
+    Помечает эндпоинт как только читающий из базы данных.
+
+    Для таких эндпоинтов get_session отдаёт сессию без транзакции:
+    не отправляются BEGIN и COMMIT, выполняется только сам запрос.
+
+    Args:
+        endpoint: Функция эндпоинта.
+
+    Returns:
+        endpoint: Та же функция эндпоинта с пометкой read_only.
+    """
+    endpoint.read_only = True  # pyright: ignore [reportFunctionMemberAccess]
+    return endpoint
+
+
+def is_read_only(request: Request) -> bool:
+    """Проверяет, помечен ли эндпоинт запроса декоратором read_only."""
+    return getattr(request.scope.get("endpoint"), "read_only", False)
+
+
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     Функция для создания экземпляра асинхронной сессии базы данных.
 
+    Соединение берётся из пула только при выполнении первого запроса.
+    Для эндпоинтов, помеченных декоратором read_only, сессия работает
+    в режиме AUTOCOMMIT и не фиксирует транзакцию. GET запросы таких эндпоинтов
+    уходят на реплику, если реплики настроены (DB_REPLICA_URLS) и пользователь
+    не делал записей в последние DB_READ_YOUR_WRITES_WINDOW секунд.
+
+    Args:
+        request: Request - Объект текущего HTTP запроса.
+
     Yields:
         AsyncSession: Асинхронная сессия SQLAlchemy.
     """
-    session_factory = async_sessionmaker(
-        bind=engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with session_factory() as session:
+    if is_read_only(request):
+        bind = read_only_engine
+        if request.method in REPLICA_READ_METHODS:
+            bind = replicas.choose(get_request_user_id(request)) or read_only_engine
+        async with ReadOnlySessionLocal(bind=bind) as session:
+            yield session
+        return
+
+    async with SessionLocal() as session:
         try:
             yield session
             await session.commit()
         except:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
-SessionLocal = async_sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False
-)
-
 DbSession = Annotated[AsyncSession, Depends(get_session)]
 
 
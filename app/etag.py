@@ -0,0 +1,49 @@
+# STDLIB
+import hashlib
+from typing import Iterable, Optional
+
+# THIRDPARTY
+from fastapi import Response, status
+
+
+def make_etag(versions: Iterable[tuple]) -> str:
+    """
+    Строит сильный ETag по идентификаторам и версиям строк ответа.
+
+    Args:
+        versions: Пары (идентификатор, версия) в том порядке, в котором строки отдаются клиенту.
+
+    Returns:
+        ETag в кавычках, готовый для заголовка ответа.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for row_id, version in versions:
+        digest.update(f"{row_id}:{version},".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверяет, совпадает ли ETag с одним из значений заголовка If-None-Match.
+
+    Для If-None-Match используется слабое сравнение (RFC 9110), поэтому префикс W/ игнорируется.
+
+    Args:
+        if_none_match: Значение заголовка If-None-Match запроса.
+        etag: Текущий ETag ресурса.
+
+    Returns:
+        True, если клиент уже получил актуальную версию ресурса.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Возвращает пустой ответ 304 Not Modified с текущим ETag.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
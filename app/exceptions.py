@@ -52,3 +52,23 @@ class NotTaskException(BaseAppException):
 class YouCanNotUpdateTaskException(BaseAppException):
     status_code = status.HTTP_409_CONFLICT
     detail = "You can not update task"
+
+
+class IncorrectCursorException(BaseAppException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Incorrect cursor"
+
+
+class ImportTimeoutException(BaseAppException):
+    status_code = status.HTTP_408_REQUEST_TIMEOUT
+    detail = "Import took too long"
+
+
+class MonitoringAccessDeniedException(BaseAppException):
+    status_code = status.HTTP_403_FORBIDDEN
+    detail = "Monitoring access denied"
+
+
+class PasswordHashingOverloadedException(BaseAppException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Too many authentication requests, try again later"
@@ -0,0 +1,247 @@
+# STDLIB
+import asyncio
+import json
+from typing import Callable, Optional
+import uuid
+
+# THIRDPARTY
+import asyncpg
+from sqlalchemy import event, make_url, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# FIRSTPARTY
+from app.config import get_db_url, settings
+from app.logger import logger
+
+PENDING_INVALIDATIONS_KEY = "pending_cache_invalidations"
+
+MAX_RECONNECT_DELAY = 30
+
+NOTIFY_QUERY = text(
+    "SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"
+)
+
+
+class InvalidationBus:
+    """
+    Шина сброса внутрипроцессных кешей между воркерами через LISTEN/NOTIFY Postgres.
+
+    Изменения, отмеченные функцией publish_invalidation, отправляются командой NOTIFY
+    в транзакции, которая их сделала, поэтому другие воркеры получают сообщение
+    только после фиксации. В своём воркере кеши сбрасываются после фиксации напрямую.
+
+    Каждый воркер держит одно соединение с LISTEN, отдельное от пула, и переподключается
+    при его потере. Пока соединения нет, кеши очищаются, а новые записи живут не дольше
+    CACHE_INVALIDATION_FALLBACK_TTL секунд: сообщения за это время могли быть потеряны.
+    """
+
+    def __init__(self, dsn: str, channel: str):
+        self.dsn = dsn
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self.connected = False
+        self.published = 0
+        self.received = 0
+        self.reconnects = 0
+        self._handlers: dict[str, list[tuple[Callable, Callable]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, entity: str, invalidate: Callable, clear: Callable) -> None:
+        """
+        Подключает кеш к шине.
+
+        Args:
+            entity: Имя сущности (таблицы), изменения которой сбрасывают кеш.
+            invalidate: Функция, сбрасывающая записи кеша одного владельца по его ID.
+            clear: Функция, очищающая кеш целиком.
+        """
+        self._handlers.setdefault(entity, []).append((invalidate, clear))
+
+    def cache_ttl(self) -> Optional[float]:
+        """
+        Отдаёт время жизни новых записей кешей, подключённых к шине.
+
+        Returns:
+            None, если записи живут обычное время кеша (шина работает или выключена),
+            иначе CACHE_INVALIDATION_FALLBACK_TTL.
+        """
+        if not settings.CACHE_INVALIDATION_BUS or self.connected:
+            return None
+        return settings.CACHE_INVALIDATION_FALLBACK_TTL
+
+    def invalidate(self, entity: str, owner_id: str) -> None:
+        """Сбрасывает записи кешей сущности entity, принадлежащие owner_id."""
+        for invalidate, _ in self._handlers.get(entity, ()):
+            invalidate(owner_id)
+
+    def clear(self) -> None:
+        """Очищает все кеши, подключённые к шине."""
+        for handlers in self._handlers.values():
+            for _, clear in handlers:
+                clear()
+
+    def payloads(self, invalidations) -> list[str]:
+        """Переводит пары (сущность, владелец) в сообщения NOTIFY."""
+        return [
+            json.dumps({"origin": self.origin, "entity": entity, "owner": owner_id})
+            for entity, owner_id in sorted(invalidations)
+        ]
+
+    def handle_notification(self, payload: str) -> None:
+        """
+        Обрабатывает сообщение NOTIFY другого воркера.
+
+        Args:
+            payload: JSON с полями origin, entity и owner.
+        """
+        try:
+            message = json.loads(payload)
+            origin, entity, owner_id = (
+                message["origin"],
+                message["entity"],
+                message["owner"],
+            )
+        except (ValueError, TypeError, KeyError):
+            logger.warning(f"Incorrect cache invalidation message: {payload!r}")
+            return
+
+        if origin == self.origin:
+            return
+
+        self.received += 1
+        self.invalidate(entity, owner_id)
+
+    def start(self) -> None:
+        """Запускает фоновую задачу, слушающую канал шины."""
+        if settings.CACHE_INVALIDATION_BUS and self._task is None:
+            self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        """Останавливает фоновую задачу и закрывает соединение."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        """
+        Отдаёт статистику шины.
+
+        Returns:
+            Словарь с состоянием соединения и числом отправленных и полученных сообщений.
+        """
+        return {
+            "enabled": settings.CACHE_INVALIDATION_BUS,
+            "connected": self.connected,
+            "published": self.published,
+            "received": self.received,
+            "reconnects": self.reconnects,
+        }
+
+    async def _listen_forever(self) -> None:
+        delay = settings.CACHE_INVALIDATION_RECONNECT_DELAY
+        while True:
+            try:
+                await self._listen()
+                delay = settings.CACHE_INVALIDATION_RECONNECT_DELAY
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation bus is down: {e}")
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        lost = asyncio.Event()
+        try:
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(
+                self.channel,
+                lambda _connection, _pid, _channel, payload: self.handle_notification(
+                    payload
+                ),
+            )
+            # Сообщения, отправленные до подписки, потеряны.
+            self._set_connected(True)
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(
+                        lost.wait(),
+                        timeout=settings.CACHE_INVALIDATION_HEALTHCHECK_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    await connection.execute(
+                        "SELECT 1",
+                        timeout=settings.CACHE_INVALIDATION_HEALTHCHECK_INTERVAL,
+                    )
+        finally:
+            self._set_connected(False)
+            connection.terminate()
+
+    def _set_connected(self, connected: bool) -> None:
+        if self.connected != connected:
+            logger.info(
+                f"Cache invalidation bus {'connected' if connected else 'disconnected'}"
+            )
+        self.connected = connected
+        self.clear()
+
+
+invalidation_bus = InvalidationBus(
+    dsn=make_url(get_db_url())
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False),
+    channel=settings.CACHE_INVALIDATION_CHANNEL,
+)
+
+
+def publish_invalidation(session: AsyncSession, entity: str, owner_id) -> None:
+    """
+    Отмечает, что в транзакции сессии изменились записи сущности entity владельца owner_id.
+
+    Перед фиксацией транзакции по отметкам отправляется NOTIFY, после фиксации
+    кеши своего воркера сбрасываются напрямую. При откате транзакции отметки удаляются.
+
+    Args:
+        session: Асинхронная сессия, в которой изменяются записи.
+        entity: Имя сущности (таблицы).
+        owner_id: ID владельца изменённых записей.
+    """
+    session.info.setdefault(PENDING_INVALIDATIONS_KEY, set()).add(
+        (entity, str(owner_id))
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_before_commit(session: Session) -> None:
+    invalidations = session.info.get(PENDING_INVALIDATIONS_KEY)
+    if not invalidations or not settings.CACHE_INVALIDATION_BUS:
+        return
+
+    session.execute(
+        NOTIFY_QUERY,
+        {
+            "channel": invalidation_bus.channel,
+            "payloads": invalidation_bus.payloads(invalidations),
+        },
+    )
+    invalidation_bus.published += len(invalidations)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for entity, owner_id in session.info.pop(PENDING_INVALIDATIONS_KEY, ()):
+        invalidation_bus.invalidate(entity, owner_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
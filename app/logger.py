@@ -1,18 +1,118 @@
 # STDLIB
+import atexit
+import copy
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import random
+
+# FIRSTPARTY
+from app.config import settings
+from app.monitoring.metrics import log_records_dropped
+
+
+class JsonFormatter(logging.Formatter):
+    """Форматирует запись лога в одну строку JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропускает только долю rate записей, сообщения которых начинаются с одного из prefixes.
+
+    Остальные записи проходят без изменений.
+    """
+
+    def __init__(self, prefixes: list[str], rate: float):
+        super().__init__()
+        self.prefixes = tuple(prefixes)
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1 or not isinstance(record.msg, str):
+            return True
+        if not record.msg.startswith(self.prefixes):
+            return True
+        return random.random() < self.rate
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Обработчик, который кладёт запись в ограниченную очередь.
+
+    Перед постановкой в очередь в записи подставляются аргументы сообщения
+    и форматируется traceback исключения: аргументы могут измениться после вызова,
+    а traceback держал бы кадры стека, пока запись в очереди. Форматирование
+    по LOG_FORMAT и запись в поток выполняет QueueListener в отдельном потоке.
+    Когда очередь заполнена,
+    запись отбрасывается (policy="drop", считается в log_records_dropped_total)
+    или вызывающий поток ждёт свободного места (policy="block").
+    """
+
+    exception_formatter = logging.Formatter()
+
+    def __init__(self, log_queue: queue.Queue, policy: str):
+        super().__init__(log_queue)
+        self.log_queue = log_queue
+        self.policy = policy
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self.exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.log_queue.put(record)
+            return
+        try:
+            self.log_queue.put_nowait(record)
+        except queue.Full:
+            log_records_dropped.inc()
+
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-
-formatter = logging.Formatter(
-    "%(asctime)s - %(module)s - %(levelname)s - %(funcName)s: %(lineno)d - %(message)s",
-    datefmt="%H:%M:%S",
-)
+if settings.LOG_FORMAT == "json":
+    formatter = JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S%z")
+else:
+    formatter = logging.Formatter(
+        "%(asctime)s - %(module)s - %(levelname)s - %(funcName)s: %(lineno)d - %(message)s",
+        datefmt="%H:%M:%S",
+    )
 
 handler = logging.StreamHandler()
 handler.setFormatter(formatter)
 
-logger.addHandler(handler)
+log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+queue_handler = BoundedQueueHandler(log_queue, policy=settings.LOG_QUEUE_POLICY)
+queue_handler.addFilter(
+    SamplingFilter(settings.LOG_SAMPLED_MESSAGES, rate=settings.LOG_SAMPLE_RATE)
+)
+listener = QueueListener(log_queue, handler, respect_handler_level=True)
+
+logger.addHandler(queue_handler)
+listener.start()
+atexit.register(listener.stop)
 
 logger.info("START")
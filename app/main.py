@@ -8,30 +8,70 @@ from fastapi import FastAPI
 from starlette.requests import Request
 
 # FIRSTPARTY
-from app.database import check_db_connection
+from app.config import settings
+from app.database import check_db_connection, engine, replicas
+from app.invalidation import invalidation_bus
 from app.logger import logger
+from app.monitoring.metrics import request_duration, requests_in_progress
+from app.monitoring.profiling import ProfilingMiddleware
+from app.monitoring.router import metrics_router
+from app.monitoring.router import router as monitoring_router
 from app.tasks.router import router as tasks_router
+from app.users.hashing import password_hash_executor
 from app.users.router import router as users_router
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     await check_db_connection()
+    invalidation_bus.start()
+    replicas.start()
     yield
+    await replicas.stop()
+    await invalidation_bus.stop()
+    await engine.dispose()
+    password_hash_executor.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
 
 app.include_router(users_router)
 app.include_router(tasks_router)
+app.include_router(monitoring_router)
+app.include_router(metrics_router)
+
+UNMATCHED_ROUTE = "unmatched"
+
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
 
 
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    """Middleware для отслеживания скорости выполнения любого HTTP запроса."""
+    """
+    Middleware для отслеживания скорости выполнения любого HTTP запроса.
+
+    Время обработки попадает в заголовок X-Process-Time, в лог и в гистограмму
+    http_request_duration_seconds по шаблону маршрута (например, /tasks/{task_id})
+    и статусу ответа, число обрабатываемых запросов - в http_requests_in_progress.
+    """
+    method = request.method
+    status_code = 500
+    requests_in_progress.inc(method=method)
     start_time = time.perf_counter()
-    response = await call_next(request)
-    process_time = time.perf_counter() - start_time
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        process_time = time.perf_counter() - start_time
+        requests_in_progress.dec(method=method)
+        route = request.scope.get("route")
+        request_duration.observe(
+            process_time,
+            method=method,
+            route=getattr(route, "path", UNMATCHED_ROUTE),
+            status=status_code,
+        )
     response.headers["X-Process-Time"] = str(process_time)
     logger.info(f"Request handling time: {round(process_time, 4)}")
     return response
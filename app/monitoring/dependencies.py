@@ -0,0 +1,26 @@
+# STDLIB
+import hmac
+
+# THIRDPARTY
+from fastapi import Request
+
+# FIRSTPARTY
+from app.config import settings
+from app.exceptions import MonitoringAccessDeniedException
+
+
+def verify_monitoring_token(request: Request) -> None:
+    """
+    Пропускает запрос к эндпоинтам /monitoring только с заголовком
+    Authorization: Bearer <MONITORING_TOKEN>.
+
+    Пока MONITORING_TOKEN не задан, эндпоинты недоступны.
+    """
+    token = settings.MONITORING_TOKEN.encode()
+    scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+    if (
+        not token
+        or scheme.lower() != "bearer"
+        or not hmac.compare_digest(credentials.encode(), token)
+    ):
+        raise MonitoringAccessDeniedException
@@ -0,0 +1,230 @@
+# STDLIB
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+import math
+from typing import Iterable
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REQUEST_DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1,
+    2.5,
+    5,
+    7.5,
+    10,
+)
+QUERY_DURATION_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+)
+
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """
+    Базовая метрика в формате Prometheus с набором меток.
+
+    Значения хранятся в памяти воркера по кортежу значений меток,
+    поэтому каждый воркер отдаёт свои метрики, а суммирует их Prometheus.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> dict:
+        return dict(zip(self.labelnames, key))
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        """Отдаёт строки значений метрики в текстовом формате Prometheus."""
+
+    def render(self) -> str:
+        """Отдаёт метрику в текстовом формате Prometheus."""
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Метрика, значение которой только растёт."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        # Метрика без меток отдаётся сразу, с нулевым значением.
+        self._values: dict[tuple, float] = {} if self.labelnames else {(): 0}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Метрика, значение которой может расти и уменьшаться."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """
+    Гистограмма с фиксированными границами корзин.
+
+    Наблюдения считаются по корзинам без накопления, накопленные значения
+    (le) считаются только при выдаче метрик.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = REQUEST_DURATION_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = (*sorted(buckets), math.inf)
+        self._counts: dict[tuple, list[int]] = {}
+        self._sums: dict[tuple, float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """
+        Добавляет наблюдение.
+
+        Args:
+            value: Наблюдаемое значение (например, длительность в секундах).
+            **labels: Значения всех меток метрики.
+        """
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * len(self.buckets)
+            self._sums[key] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def samples(self) -> Iterable[str]:
+        for key, counts in self._counts.items():
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                bucket_labels = _format_labels({**labels, "le": _format_value(bound)})
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(labels)} {self._sums[key]!r}"
+            yield f"{self.name}_count{_format_labels(labels)} {cumulative}"
+
+
+class MetricsRegistry:
+    """Набор метрик, отдаваемых эндпоинтом /metrics."""
+
+    def __init__(self, metrics: Iterable[Metric]):
+        self._metrics = list(metrics)
+
+    def render(self) -> str:
+        """
+        Отдаёт все метрики в текстовом формате Prometheus (version 0.0.4).
+
+        Returns:
+            Текст метрик, оканчивающийся переводом строки.
+        """
+        return "".join(f"{metric.render()}\n" for metric in self._metrics)
+
+
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request handling time by route template and status.",
+    labelnames=("method", "route", "status"),
+)
+requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled right now.",
+    labelnames=("method",),
+)
+query_duration = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time by database and operation.",
+    labelnames=("database", "operation"),
+    buckets=QUERY_DURATION_BUCKETS,
+)
+
+log_records_dropped = Counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full.",
+)
+
+registry = MetricsRegistry(
+    [request_duration, requests_in_progress, query_duration, log_records_dropped]
+)
+
+
+def sql_operation(statement: str) -> str:
+    """
+    Отдаёт вид SQL запроса для метки operation.
+
+    Args:
+        statement: Текст SQL запроса.
+
+    Returns:
+        Первое ключевое слово запроса (SELECT, INSERT...) или OTHER.
+    """
+    words = statement.split(None, 1)
+    operation = words[0].upper() if words else ""
+    return operation if operation in SQL_OPERATIONS else "OTHER"
@@ -0,0 +1,216 @@
+# STDLIB
+import asyncio
+from collections import Counter
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from types import FrameType
+import uuid
+
+# THIRDPARTY
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# FIRSTPARTY
+from app.config import settings
+from app.logger import logger
+
+PROFILE_ID_HEADER = b"x-profile-id"
+PROFILE_SUFFIX = ".folded"
+
+
+def _frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def task_stack(task: asyncio.Task, thread_id: int) -> list[str]:
+    """
+    Отдаёт стек задачи asyncio от внешней корутины к самому глубокому кадру.
+
+    Цепочка корутин строится по cr_await. Если задача сейчас выполняется в потоке
+    event loop, к ней добавляются синхронные вызовы из стека потока, иначе последним
+    элементом идёт объект, которого ждёт задача (например, "await Future").
+
+    Args:
+        task: Задача asyncio.
+        thread_id: ID потока, в котором работает event loop задачи.
+
+    Returns:
+        Имена кадров стека.
+    """
+    frames: list[FrameType] = []
+    awaited = task.get_coro()
+    while awaited is not None:
+        frame = getattr(awaited, "cr_frame", None) or getattr(awaited, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        awaited = getattr(awaited, "cr_await", None) or getattr(
+            awaited, "gi_yieldfrom", None
+        )
+
+    if not frames:
+        return []
+
+    stack = [_frame_name(frame) for frame in frames]
+    if awaited is not None:
+        # Future ожидается через свой итератор (FutureIter).
+        return [*stack, f"await {type(awaited).__name__.removesuffix('Iter')}"]
+
+    running: list[FrameType] = []
+    frame = sys._current_frames().get(thread_id)
+    while frame is not None and frame is not frames[-1]:
+        running.append(frame)
+        frame = frame.f_back
+    if frame is None:
+        # Задача не выполняется и ничего не ждёт: только что проснулась или завершилась.
+        return stack
+    return [*stack, *(_frame_name(frame) for frame in reversed(running))]
+
+
+class TaskSampler:
+    """
+    Профилировщик одной задачи asyncio по реальному (wall-clock) времени.
+
+    Отдельный поток раз в interval секунд снимает стек задачи, поэтому в профиль
+    попадает и время ожидания (await базы данных, пула соединений), и время
+    выполнения кода, но не работа других запросов в том же event loop.
+    Пока event loop занят кодом, поток получает GIL реже, поэтому каждому снимку
+    засчитывается время с предыдущего снимка в микросекундах, а не один снимок.
+    """
+
+    def __init__(self, task: asyncio.Task, interval: float):
+        self.task = task
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """
+        Останавливает профилирование.
+
+        Returns:
+            Время в микросекундах для каждого стека (кадры через ";").
+        """
+        self._stopped.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        previous = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            stack = task_stack(self.task, self._thread_id)
+            now = time.perf_counter()
+            if stack:
+                self.samples[";".join(stack)] += round((now - previous) * 1_000_000)
+            previous = now
+
+
+def store_profile(directory: str, name: str, samples: Counter[str], max_bytes: int):
+    """
+    Сохраняет профиль в формате collapsed stacks и удаляет самые старые профили,
+    пока их общий размер больше max_bytes.
+
+    Формат читают flamegraph.pl и speedscope.
+
+    Args:
+        directory: Каталог профилей.
+        name: Имя файла профиля.
+        samples: Время в микросекундах для каждого стека.
+        max_bytes: Максимальный общий размер профилей в каталоге.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, name), "w", encoding="utf-8") as file:
+        file.writelines(f"{stack} {count}\n" for stack, count in samples.items())
+
+    profiles = [
+        entry
+        for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.endswith(PROFILE_SUFFIX)
+    ]
+    profiles.sort(key=lambda entry: entry.stat().st_mtime)
+    total = sum(entry.stat().st_size for entry in profiles)
+    for entry in profiles:
+        if total <= max_bytes:
+            break
+        total -= entry.stat().st_size
+        os.remove(entry.path)
+
+
+class ProfilingMiddleware:
+    """
+    Middleware, профилирующий отдельные запросы.
+
+    Запрос профилируется, если в нём есть заголовок PROFILING_HEADER со значением
+    PROFILING_TOKEN или он попал в долю PROFILING_SAMPLE_RATE. Без PROFILING_TOKEN
+    заголовок не действует, и профилируется только доля PROFILING_SAMPLE_RATE.
+    Одновременно профилируется не больше PROFILING_MAX_CONCURRENT запросов.
+    Профиль сохраняется в PROFILING_DIR, его имя отдаётся в заголовке X-Profile-Id.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.active = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        path = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+        name = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method']}-{path}"
+            f"-{uuid.uuid4().hex[:8]}{PROFILE_SUFFIX}"
+        )
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (PROFILE_ID_HEADER, name.encode()),
+                ]
+            await send(message)
+
+        sampler = TaskSampler(
+            asyncio.current_task(),  # pyright: ignore [reportArgumentType]
+            interval=settings.PROFILING_INTERVAL,
+        )
+        self.active += 1
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            samples = await asyncio.to_thread(sampler.stop)
+            self.active -= 1
+            try:
+                await asyncio.to_thread(
+                    store_profile,
+                    settings.PROFILING_DIR,
+                    name,
+                    samples,
+                    settings.PROFILING_DIR_MAX_BYTES,
+                )
+            except OSError as e:
+                logger.warning(f"Unable to store profile {name}: {e}")
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if self.active >= settings.PROFILING_MAX_CONCURRENT:
+            return False
+
+        if settings.PROFILING_TOKEN:
+            header = settings.PROFILING_HEADER.lower().encode()
+            token = settings.PROFILING_TOKEN.encode()
+            for key, value in scope["headers"]:
+                if key == header and hmac.compare_digest(value, token):
+                    return True
+
+        return random.random() < settings.PROFILING_SAMPLE_RATE
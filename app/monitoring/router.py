@@ -0,0 +1,124 @@
+# THIRDPARTY
+from fastapi import APIRouter, Depends, Response
+
+# FIRSTPARTY
+from app.dao.base import statement_cache
+from app.database import get_pool_stats, get_statement_cache_stats, replicas
+from app.invalidation import invalidation_bus
+from app.monitoring.dependencies import verify_monitoring_token
+from app.monitoring.metrics import PROMETHEUS_CONTENT_TYPE, registry
+from app.monitoring.schemas import (
+    SCachesStats,
+    SCacheStats,
+    SInvalidationBusStats,
+    SPasswordHashStats,
+    SPoolStats,
+    SReplicasStats,
+    SStatementCachesStats,
+    SStatementCacheStats,
+)
+from app.tasks.cache import tasks_response_cache
+from app.users.cache import principal_cache, token_cache
+from app.users.hashing import password_hash_executor
+
+router = APIRouter(
+    prefix="/monitoring",
+    tags=["Мониторинг"],
+    dependencies=[Depends(verify_monitoring_token)],
+)
+
+metrics_router = APIRouter(tags=["Мониторинг"])
+
+
+@router.get("/pool")
+async def get_pool() -> SPoolStats:
+    """
+    Отдаёт статистику пула соединений с базой данных.
+
+    Returns:
+        pool_stats: Экземпляр Pydantic модели SPoolStats, представляющий состояние пула.
+    """
+    return SPoolStats(**get_pool_stats())
+
+
+@router.get("/cache")
+async def get_cache() -> SCachesStats:
+    """
+    Отдаёт статистику внутрипроцессных кешей.
+
+    Returns:
+        caches_stats: Экземпляр Pydantic модели SCachesStats, представляющий попадания и промахи кешей.
+    """
+    return SCachesStats(
+        principals=SCacheStats(**principal_cache.stats()),
+        tokens=SCacheStats(**token_cache.stats()),
+        tasks_responses=SCacheStats(**tasks_response_cache.stats()),
+    )
+
+
+@router.get("/statements")
+async def get_statements() -> SStatementCachesStats:
+    """
+    Отдаёт статистику кешей запросов: запросов DAO, построенных по сигнатуре вызова,
+    кеша компиляции SQLAlchemy и кеша подготовленных запросов asyncpg.
+
+    Returns:
+        statements_stats: Экземпляр Pydantic модели SStatementCachesStats, представляющий попадания и промахи кешей.
+    """
+    dao_stats = statement_cache.stats()
+    statements_stats = get_statement_cache_stats()
+    return SStatementCachesStats(
+        dao=SStatementCacheStats(
+            hits=dao_stats["hits"],
+            misses=dao_stats["misses"],
+            maxsize=dao_stats["maxsize"],
+        ),
+        compiled=SStatementCacheStats(**statements_stats["compiled"]),
+        prepared=SStatementCacheStats(**statements_stats["prepared"]),
+    )
+
+
+@router.get("/invalidation")
+async def get_invalidation() -> SInvalidationBusStats:
+    """
+    Отдаёт состояние шины сброса кешей между воркерами.
+
+    Returns:
+        bus_stats: Экземпляр Pydantic модели SInvalidationBusStats, представляющий соединение и число сообщений.
+    """
+    return SInvalidationBusStats(**invalidation_bus.stats())
+
+
+@router.get("/replicas")
+async def get_replicas() -> SReplicasStats:
+    """
+    Отдаёт состояние реплик базы данных и распределение читающих запросов.
+
+    Returns:
+        replicas_stats: Экземпляр Pydantic модели SReplicasStats, представляющий реплики в ротации и число чтений.
+    """
+    return SReplicasStats(**replicas.stats())
+
+
+@router.get("/hashing")
+async def get_hashing() -> SPasswordHashStats:
+    """
+    Отдаёт статистику пула хеширования паролей.
+
+    Returns:
+        hashing_stats: Экземпляр Pydantic модели SPasswordHashStats, представляющий очередь и время хеширования.
+    """
+    return SPasswordHashStats(**password_hash_executor.stats())
+
+
+@metrics_router.get("/metrics")
+async def get_metrics() -> Response:
+    """
+    Отдаёт метрики воркера в текстовом формате Prometheus: гистограммы времени
+    обработки запросов по маршрутам и статусам, число обрабатываемых запросов
+    и гистограммы времени выполнения SQL запросов.
+
+    Returns:
+        Response с метриками (text/plain; version=0.0.4).
+    """
+    return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,78 @@
+# STDLIB
+from typing import List, Optional
+
+# THIRDPARTY
+from pydantic import BaseModel, computed_field
+
+
+class SPoolStats(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checked_out: Optional[int] = None
+    idle: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checkouts: Optional[int] = None
+    wait_time_total: Optional[float] = None
+    wait_time_max: Optional[float] = None
+
+
+class SCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class SCachesStats(BaseModel):
+    principals: SCacheStats
+    tokens: SCacheStats
+    tasks_responses: SCacheStats
+
+
+class SStatementCacheStats(BaseModel):
+    hits: int
+    misses: int
+    maxsize: int
+
+    @computed_field
+    @property
+    def hit_rate(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+
+class SStatementCachesStats(BaseModel):
+    dao: SStatementCacheStats
+    compiled: SStatementCacheStats
+    prepared: SStatementCacheStats
+
+
+class SInvalidationBusStats(BaseModel):
+    enabled: bool
+    connected: bool
+    published: int
+    received: int
+    reconnects: int
+
+
+class SReplicaStats(BaseModel):
+    name: str
+    healthy: bool
+    reads: int
+
+
+class SReplicasStats(BaseModel):
+    replicas: List[SReplicaStats]
+    primary_reads: int
+
+
+class SPasswordHashStats(BaseModel):
+    kind: str
+    max_workers: int
+    pending: int
+    max_pending: int
+    completed: int
+    rejected: int
+    time_total: float
+    time_max: float
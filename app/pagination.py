@@ -0,0 +1,42 @@
+# STDLIB
+import base64
+import binascii
+import json
+
+# FIRSTPARTY
+from app.exceptions import IncorrectCursorException
+
+
+def encode_cursor(*values) -> str:
+    """
+    Упаковывает значения ключа сортировки последней записи страницы в курсор.
+
+    Args:
+        values: Значения ключа сортировки (должны сериализоваться в JSON).
+
+    Returns:
+        Непрозрачная для клиента строка курсора.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Распаковывает курсор, созданный функцией encode_cursor.
+
+    Args:
+        cursor: Строка курсора, полученная клиентом на предыдущей странице.
+        size: Ожидаемое число значений в курсоре.
+
+    Returns:
+        Список значений ключа сортировки.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise IncorrectCursorException
+    if not isinstance(values, list) or len(values) != size:
+        raise IncorrectCursorException
+    return values
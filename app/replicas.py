@@ -0,0 +1,183 @@
+# STDLIB
+import asyncio
+from typing import Optional
+
+# THIRDPARTY
+from fastapi import Request
+import jwt
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# FIRSTPARTY
+from app.cache import TTLCache
+from app.config import settings
+from app.invalidation import invalidation_bus
+from app.logger import logger
+
+REPLICA_READ_METHODS = ("GET", "HEAD")
+
+
+class ReplicaSet:
+    """
+    Реплики базы данных, на которые уходят читающие GET запросы.
+
+    Реплики выбираются по кругу из тех, что прошли последнюю проверку здоровья.
+    Проверка (SELECT 1 с таймаутом) выполняется фоновой задачей раз в
+    DB_REPLICA_HEALTHCHECK_INTERVAL секунд, упавшая реплика выводится из ротации
+    и возвращается после первой успешной проверки.
+
+    Чтения пользователя уходят на основную базу, пока не прошло DB_READ_YOUR_WRITES_WINDOW
+    секунд с его последней записи. Записи отмечаются через шину сброса кешей,
+    поэтому окно действует и в других воркерах. Пока шина не подключена или
+    выключена (CACHE_INVALIDATION_BUS=False), о записях в других воркерах неизвестно,
+    и все чтения уходят на основную базу.
+    """
+
+    def __init__(self, engines: list[AsyncEngine]):
+        self.engines = engines
+        self.healthy = list(engines)
+        self.reads = {id(engine): 0 for engine in engines}
+        self.primary_reads = 0
+        self.recent_writes = TTLCache(
+            maxsize=settings.DB_READ_YOUR_WRITES_CACHE_SIZE,
+            ttl=settings.DB_READ_YOUR_WRITES_WINDOW,
+        )
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def mark_write(self, user_id) -> None:
+        """
+        Отмечает запись пользователя: его чтения уходят на основную базу
+        в течение DB_READ_YOUR_WRITES_WINDOW секунд.
+
+        Args:
+            user_id: ID пользователя.
+        """
+        self.recent_writes.set(str(user_id), True)
+
+    def choose(self, user_id: Optional[str]) -> Optional[AsyncEngine]:
+        """
+        Выбирает реплику для читающего запроса.
+
+        Args:
+            user_id: ID пользователя запроса, если он известен.
+
+        Returns:
+            Движок реплики или None, если чтение должно уйти на основную базу.
+        """
+        if not self.engines:
+            return None
+
+        if (
+            not self.healthy
+            or not settings.CACHE_INVALIDATION_BUS
+            or not invalidation_bus.connected
+            or (user_id is not None and self.recent_writes.get(user_id))
+        ):
+            self.primary_reads += 1
+            return None
+
+        self._next %= len(self.healthy)
+        engine = self.healthy[self._next]
+        self._next += 1
+        self.reads[id(engine)] += 1
+        return engine
+
+    async def check(self) -> None:
+        """Проверяет реплики и оставляет в ротации только отвечающие."""
+        results = await asyncio.gather(
+            *(self._check_replica(engine) for engine in self.engines)
+        )
+        healthy = [engine for engine, ok in zip(self.engines, results) if ok]
+        for engine in self.engines:
+            if (engine in healthy) != (engine in self.healthy):
+                state = "back in rotation" if engine in healthy else "out of rotation"
+                logger.warning(f"Database replica {self._name(engine)} is {state}")
+        self.healthy = healthy
+
+    def start(self) -> None:
+        """Запускает фоновую задачу, проверяющую реплики."""
+        if self.engines and not settings.CACHE_INVALIDATION_BUS:
+            logger.warning(
+                "Database replicas are configured, but CACHE_INVALIDATION_BUS is off: "
+                "all reads go to the primary database"
+            )
+        if self.engines and self._task is None:
+            self._task = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        """Останавливает проверку реплик и закрывает их пулы соединений."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for engine in self.engines:
+            await engine.dispose()
+
+    def stats(self) -> dict:
+        """
+        Отдаёт статистику маршрутизации чтений.
+
+        Returns:
+            Словарь с состоянием и числом чтений каждой реплики и числом GET чтений,
+            ушедших на основную базу. Реплики называются по номеру в DB_REPLICA_URLS
+            (replica-0, replica-1...), адреса и пользователи баз данных не отдаются.
+        """
+        return {
+            "replicas": [
+                {
+                    "name": f"replica-{number}",
+                    "healthy": engine in self.healthy,
+                    "reads": self.reads[id(engine)],
+                }
+                for number, engine in enumerate(self.engines)
+            ],
+            "primary_reads": self.primary_reads,
+        }
+
+    async def _check_forever(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(settings.DB_REPLICA_HEALTHCHECK_INTERVAL)
+
+    async def _check_replica(self, engine: AsyncEngine) -> bool:
+        try:
+            async with asyncio.timeout(settings.DB_REPLICA_HEALTHCHECK_TIMEOUT):
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.debug(f"Database replica {self._name(engine)} check failed: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _name(engine: AsyncEngine) -> str:
+        return engine.url.render_as_string(hide_password=True)
+
+
+def get_request_user_id(request: Request) -> Optional[str]:
+    """
+    Отдаёт ID пользователя из токена запроса без проверки подписи.
+
+    ID нужен только для выбора базы: поддельный токен в худшем случае отправит
+    чтение на основную базу, а сам токен проверяется зависимостью get_current_user.
+
+    Args:
+        request: Request - Объект текущего HTTP запроса.
+
+    Returns:
+        ID пользователя или None, если токена нет или он некорректен.
+    """
+    token = request.cookies.get("access_token")
+    if not token:
+        return None
+    try:
+        payload = jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+    user_id = payload.get("sub")
+    return str(user_id) if user_id else None
@@ -0,0 +1,94 @@
+# STDLIB
+from typing import Any, Hashable, Optional
+import uuid
+
+# FIRSTPARTY
+from app.cache import CacheBackend, TTLCache
+from app.config import settings
+from app.invalidation import invalidation_bus
+
+
+class TasksResponseCache:
+    """
+    Кеш готовых ответов на чтение задач, разделённый по пользователям.
+
+    Кеш подключён к шине сброса кешей (app/invalidation.py): изменения задач пользователя
+    в любом воркере сбрасывают его записи.
+
+    Ключ записи содержит поколение пользователя - случайную строку, которая хранится
+    в отдельном хранилище generations, поэтому поколения не попадают в статистику
+    попаданий, промахов и размера кеша ответов. Сброс кеша пользователя удаляет
+    поколение, и все его записи становятся недостижимы (их вытеснит LRU или TTL).
+    Поколение берётся до чтения из базы данных, поэтому ответ, прочитанный до сброса,
+    не попадёт под новое поколение.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, generations: Optional[CacheBackend] = None
+    ):
+        self.backend = backend
+        self.generations = generations or TTLCache(
+            maxsize=settings.TASKS_RESPONSE_CACHE_SIZE,
+            ttl=settings.TASKS_RESPONSE_CACHE_TTL,
+        )
+
+    def key(self, user_id, params: Hashable) -> tuple:
+        """
+        Строит ключ записи для текущего поколения пользователя.
+
+        Args:
+            user_id: ID пользователя.
+            params: Параметры запроса, от которых зависит ответ.
+
+        Returns:
+            Ключ для методов get и set.
+        """
+        generation = self.generations.get(str(user_id))
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.generations.set(str(user_id), generation)
+        return (str(user_id), generation, params)
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Отдаёт сохранённый ответ по ключу или None."""
+        return self.backend.get(key)
+
+    def set(self, key: tuple, value: Any) -> None:
+        """
+        Сохраняет ответ по ключу.
+
+        Пока шина сброса кешей недоступна, запись живёт не дольше CACHE_INVALIDATION_FALLBACK_TTL.
+        """
+        self.backend.set(key, value, ttl=invalidation_bus.cache_ttl())
+
+    def invalidate(self, user_id) -> None:
+        """
+        Сбрасывает все сохранённые ответы пользователя.
+
+        Args:
+            user_id: ID пользователя.
+        """
+        self.generations.delete(str(user_id))
+
+    def clear(self) -> None:
+        """Удаляет все сохранённые ответы."""
+        self.generations.clear()
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        """Отдаёт статистику хранилища кеша."""
+        return self.backend.stats()
+
+
+tasks_response_cache = TasksResponseCache(
+    TTLCache(
+        maxsize=settings.TASKS_RESPONSE_CACHE_SIZE,
+        ttl=settings.TASKS_RESPONSE_CACHE_TTL,
+    )
+)
+
+invalidation_bus.register(
+    "tasks",
+    invalidate=tasks_response_cache.invalidate,
+    clear=tasks_response_cache.clear,
+)
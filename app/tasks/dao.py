@@ -1,14 +1,37 @@
+# STDLIB
+from typing import Optional, Sequence
+
 # THIRDPARTY
-from sqlalchemy import select
+from sqlalchemy import and_, any_, bindparam, func, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # FIRSTPARTY
 from app.dao.base import BaseDao
-from app.tasks.models import Tasks
+from app.tasks.models import (
+    ALLOWED_PREVIOUS_STATUSES,
+    TASKS_SEARCH_CONFIG,
+    StatusEnum,
+    Tasks,
+    TaskStatusCounters,
+)
+
+tasks_table = Tasks.__table__
+
+# Колонки таблицы tasks для чтения без ORM: по ним строятся лёгкие строки результата
+# (Row) вместо экземпляров Tasks - без identity map и отслеживания атрибутов.
+# В условиях таких запросов тоже используются колонки таблицы, а не атрибуты модели,
+# иначе SQLAlchemy компилирует и выполняет запрос через ORM.
+TASK_ROW_COLUMNS = tuple(
+    tasks_table.c[name]
+    for name in ("uuid", "user_id", "name", "description", "status", "version")
+)
+TASK_VERSION_COLUMNS = (tasks_table.c.uuid, tasks_table.c.version)
 
 
 class TasksDAO(BaseDao):
     model = Tasks
+    owner_field = "user_id"
 
     @classmethod
     async def find_all_users_tasks(
@@ -17,16 +40,159 @@ class TasksDAO(BaseDao):
         user_id: str,
         page: int,
         page_size: int,
+        statuses: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence] = None,
     ):
         offset = (page - 1) * page_size
 
         all_tasks_query = (
-            select(Tasks)
-            .where(Tasks.user_id == user_id)
+            (select(*columns) if columns else select(Tasks))
+            .where(tasks_table.c.user_id == user_id)
+            .order_by(tasks_table.c.uuid)
             .offset(offset)
             .limit(page_size)
         )
+        if statuses:
+            all_tasks_query = all_tasks_query.where(tasks_table.c.status.in_(statuses))
 
         all_tasks = await session.execute(all_tasks_query)
 
-        return all_tasks.scalars().all()
+        return all_tasks.all() if columns else all_tasks.scalars().all()
+
+    @classmethod
+    async def find_users_tasks_after(
+        cls,
+        session: AsyncSession,
+        user_id: str,
+        after: Optional[str],
+        limit: int,
+        statuses: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence] = None,
+    ):
+        tasks_query = (
+            (select(*columns) if columns else select(Tasks))
+            .where(tasks_table.c.user_id == user_id)
+            .order_by(tasks_table.c.uuid)
+            .limit(limit)
+        )
+        if after is not None:
+            tasks_query = tasks_query.where(tasks_table.c.uuid > after)
+        if statuses:
+            tasks_query = tasks_query.where(tasks_table.c.status.in_(statuses))
+
+        tasks = await session.execute(tasks_query)
+
+        return tasks.all() if columns else tasks.scalars().all()
+
+    @classmethod
+    async def find_users_task_row(
+        cls,
+        session: AsyncSession,
+        task_id: str,
+        user_id: str,
+        columns: Sequence = TASK_ROW_COLUMNS,
+    ):
+        task_query = select(*columns).where(
+            tasks_table.c.uuid == task_id, tasks_table.c.user_id == user_id
+        )
+
+        task = await session.execute(task_query)
+
+        return task.one_or_none()
+
+    @classmethod
+    async def update_users_tasks_status(
+        cls,
+        session: AsyncSession,
+        user_id: str,
+        task_ids: Sequence,
+        status: str,
+    ) -> dict:
+        task_ids_param = bindparam(
+            "task_ids", list(task_ids), type_=ARRAY(UUID(as_uuid=True))
+        )
+
+        updated_tasks = (
+            update(Tasks)
+            .where(
+                Tasks.uuid == any_(task_ids_param),
+                Tasks.user_id == user_id,
+                Tasks.status.in_(ALLOWED_PREVIOUS_STATUSES[StatusEnum(status)]),
+            )
+            .values(status=status)
+            .returning(Tasks.uuid)
+            .cte("updated_tasks")
+        )
+
+        found_tasks_query = select(
+            Tasks.uuid, Tasks.uuid.in_(select(updated_tasks.c.uuid))
+        ).where(Tasks.uuid == any_(task_ids_param), Tasks.user_id == user_id)
+
+        found_tasks = await session.execute(found_tasks_query)
+        results = {task_id: updated for task_id, updated in found_tasks.all()}
+        if any(results.values()):
+            cls.publish_changes(session, [user_id])
+
+        return results
+
+    @classmethod
+    async def search_users_tasks(
+        cls,
+        session: AsyncSession,
+        user_id: str,
+        query: str,
+        after: Optional[tuple[float, str]],
+        limit: int,
+    ):
+        ts_query = func.websearch_to_tsquery(TASKS_SEARCH_CONFIG, query)
+        rank = func.ts_rank(Tasks.search_vector, ts_query)
+
+        search_query = (
+            select(Tasks, rank.label("rank"))
+            .where(
+                Tasks.user_id == user_id, Tasks.search_vector.bool_op("@@")(ts_query)
+            )
+            .order_by(rank.desc(), Tasks.uuid)
+            .limit(limit)
+        )
+        if after is not None:
+            after_rank, after_uuid = after
+            search_query = search_query.where(
+                or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, Tasks.uuid > after_uuid),
+                )
+            )
+
+        found_tasks = await session.execute(search_query)
+
+        return found_tasks.all()
+
+    @classmethod
+    async def stream_all_users_tasks(
+        cls, session: AsyncSession, user_id: str, chunk_size: int
+    ):
+        tasks_query = (
+            select(Tasks)
+            .where(Tasks.user_id == user_id)
+            .order_by(Tasks.uuid)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        return await session.stream_scalars(tasks_query)
+
+    @classmethod
+    async def count_users_tasks_by_status(
+        cls, session: AsyncSession, user_id: str
+    ) -> dict:
+        counters_query = select(
+            TaskStatusCounters.status, TaskStatusCounters.count
+        ).where(TaskStatusCounters.user_id == user_id)
+
+        counters = await session.execute(counters_query)
+
+        stats = {status.value: 0 for status in StatusEnum}
+        for status, count in counters:
+            stats[status.value] = count
+
+        return stats
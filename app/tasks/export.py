@@ -0,0 +1,76 @@
+# STDLIB
+import csv
+import io
+import json
+from typing import AsyncIterator, Literal
+
+# FIRSTPARTY
+from app.database import SessionLocal
+from app.tasks.dao import TasksDAO
+from app.tasks.models import Tasks
+
+EXPORT_FIELDS = ["uuid", "user_id", "name", "description", "status"]
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def task_to_row(task: Tasks) -> list:
+    """Отдаёт значения полей задачи в порядке EXPORT_FIELDS."""
+    return [
+        str(task.uuid),
+        str(task.user_id),
+        task.name,
+        task.description,
+        task.status.value,
+    ]
+
+
+def format_ndjson(tasks: list[Tasks]) -> str:
+    """Форматирует задачи в NDJSON (один JSON объект на строку)."""
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, task_to_row(task))), ensure_ascii=False)
+        + "\n"
+        for task in tasks
+    )
+
+
+def format_csv(tasks: list[Tasks]) -> str:
+    """Форматирует задачи в строки CSV без заголовка."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(task_to_row(task) for task in tasks)
+    return buffer.getvalue()
+
+
+async def stream_tasks_export(
+    user_id: str, file_format: Literal["ndjson", "csv"], chunk_size: int
+) -> AsyncIterator[str]:
+    """
+    Отдаёт задачи пользователя частями, читая их из серверного курсора.
+
+    В памяти одновременно находится не больше chunk_size задач, поэтому
+    потребление памяти не зависит от числа задач пользователя.
+    Сессия открывается внутри генератора, так как сессия из зависимости
+    закрывается до начала отправки ответа.
+
+    Args:
+        user_id: ID пользователя, задачи которого выгружаются.
+        file_format: Формат выгрузки - ndjson или csv.
+        chunk_size: Число задач, читаемых из курсора за один раз.
+
+    Yields:
+        Очередная часть выгрузки.
+    """
+    if file_format == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(EXPORT_FIELDS)
+        yield header.getvalue()
+
+    format_chunk = format_csv if file_format == "csv" else format_ndjson
+
+    async with SessionLocal() as session:
+        tasks = await TasksDAO.stream_all_users_tasks(
+            session=session, user_id=user_id, chunk_size=chunk_size
+        )
+        async for tasks_chunk in tasks.partitions():
+            yield format_chunk(list(tasks_chunk))
@@ -0,0 +1,254 @@
+# STDLIB
+import codecs
+import csv
+import json
+import time
+from typing import AsyncIterator, Literal, Optional
+
+# THIRDPARTY
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# FIRSTPARTY
+from app.monitoring.metrics import query_duration
+from app.tasks.dao import TasksDAO
+from app.tasks.schemas import SAddTasks
+
+IMPORT_COLUMNS = ["user_id", "name", "description", "status"]
+
+MAX_REPORTED_ERRORS = 1000
+
+MAX_LINE_LENGTH = 64 * 1024
+MAX_CSV_RECORD_LENGTH = 64 * 1024
+
+LINE_TOO_LONG_ERROR = f"Line too long: more than {MAX_LINE_LENGTH} characters"
+
+
+async def iter_lines(
+    stream: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, Optional[str]]]:
+    """
+    Разбивает поток байтов тела запроса на строки, не читая его целиком.
+
+    В памяти держится не больше MAX_LINE_LENGTH символов незавершённой строки:
+    вместо более длинной строки отдаётся None, а её остаток пропускается
+    до следующего перевода строки.
+
+    Args:
+        stream: Поток байтов тела запроса.
+
+    Yields:
+        (line_number, line): Номер строки (с единицы) и сама строка без перевода строки
+        либо None, если строка длиннее MAX_LINE_LENGTH.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    line_number = 0
+    skipping = False
+    async for chunk in stream:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            if skipping:
+                # Конец слишком длинной строки, о которой уже сообщено.
+                skipping = False
+                continue
+            yield (
+                line_number,
+                None if len(line) > MAX_LINE_LENGTH else line.rstrip("\r"),
+            )
+
+        if len(buffer) > MAX_LINE_LENGTH:
+            if not skipping:
+                yield line_number + 1, None
+                skipping = True
+            buffer = ""
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer and not skipping:
+        line = None if len(buffer) > MAX_LINE_LENGTH else buffer.rstrip("\r")
+        yield line_number + 1, line
+
+
+async def iter_ndjson_records(
+    lines: AsyncIterator[tuple[int, Optional[str]]],
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """
+    Разбирает строки NDJSON.
+
+    Yields:
+        (line_number, record): Номер строки и словарь с данными задачи
+        либо текст ошибки, если строку не удалось разобрать.
+    """
+    async for line_number, line in lines:
+        if line is None:
+            yield line_number, LINE_TOO_LONG_ERROR
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Invalid JSON: object expected"
+            continue
+        yield line_number, record
+
+
+async def iter_csv_records(
+    lines: AsyncIterator[tuple[int, Optional[str]]],
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """
+    Разбирает строки CSV, первая строка - заголовок с названиями полей.
+
+    Значение в кавычках может занимать несколько строк, поэтому строки
+    накапливаются, пока число кавычек в записи не станет чётным. Запись длиннее
+    MAX_CSV_RECORD_LENGTH (например, из-за лишней кавычки) считается ошибочной.
+
+    Yields:
+        (line_number, record): Номер первой строки записи и словарь с данными задачи
+        либо текст ошибки, если запись не удалось разобрать.
+    """
+    header = None
+    record_lines: list[str] = []
+    record_line_number = 0
+    record_length = 0
+    quotes = 0
+    async for line_number, line in lines:
+        if not record_lines:
+            record_line_number = line_number
+        if line is None:
+            record_lines, record_length, quotes = [], 0, 0
+            yield line_number, LINE_TOO_LONG_ERROR
+            continue
+
+        record_lines.append(line)
+        record_length += len(line) + 1
+        quotes += line.count('"')
+        if quotes % 2:
+            if record_length > MAX_CSV_RECORD_LENGTH:
+                record_lines, record_length, quotes = [], 0, 0
+                yield record_line_number, "Invalid CSV: record too long"
+            continue
+
+        record_text = "\n".join(record_lines)
+        record_lines, record_length, quotes = [], 0, 0
+
+        if not record_text.strip():
+            continue
+        try:
+            (row,) = csv.reader([record_text])
+        except (csv.Error, ValueError) as e:
+            yield record_line_number, f"Invalid CSV: {e}"
+            continue
+
+        if header is None:
+            header = row
+            continue
+        if len(row) != len(header):
+            yield record_line_number, "Invalid CSV: wrong number of columns"
+            continue
+        yield (
+            record_line_number,
+            {key: value or None for key, value in zip(header, row)},
+        )
+
+    if record_lines:
+        yield record_line_number, "Invalid CSV: unterminated quoted field"
+
+
+def validation_error_message(error: ValidationError) -> str:
+    """Отдаёт краткое описание ошибок валидации строки."""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}"
+        for err in error.errors()
+    )
+
+
+async def import_tasks(
+    session: AsyncSession,
+    user_id,
+    stream: AsyncIterator[bytes],
+    file_format: Literal["ndjson", "csv"],
+    batch_size: int,
+) -> dict:
+    """
+    Загружает задачи пользователя из потока NDJSON/CSV через COPY.
+
+    Строки проверяются Pydantic моделью SAddTasks, корректные строки
+    накапливаются пачками по batch_size и записываются в таблицу tasks
+    через asyncpg copy_records_to_table. Все пачки записываются в одной
+    транзакции с остальными запросами сессии.
+
+    Args:
+        session: Асинхронная сессия базы данных.
+        user_id: ID пользователя, которому добавляются задачи.
+        stream: Поток байтов тела запроса.
+        file_format: Формат загрузки - ndjson или csv.
+        batch_size: Число задач в одной пачке COPY.
+
+    Returns:
+        Словарь с числом загруженных и ошибочных строк и списком ошибок
+        (не больше MAX_REPORTED_ERRORS).
+    """
+    lines = iter_lines(stream)
+    records = (
+        iter_csv_records(lines) if file_format == "csv" else iter_ndjson_records(lines)
+    )
+
+    connection = await session.connection()
+    # Адаптер asyncpg SQLAlchemy начинает транзакцию только на первом запросе. Если сессия
+    # ещё ничего не выполняла (пользователь взят из кеша), без этого запроса
+    # driver_connection.transaction() ниже открыл бы отдельную транзакцию и
+    # зафиксировал COPY независимо от фиксации или отката сессии.
+    await connection.exec_driver_sql("SELECT 1")
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    imported = 0
+    failed = 0
+    errors = []
+    batch = []
+
+    async def copy_batch(batch_records: list[tuple]):
+        # COPY asyncpg не проходит через события движка, поэтому время считается здесь.
+        start_time = time.perf_counter()
+        await driver_connection.copy_records_to_table(  # pyright: ignore [reportOptionalMemberAccess]
+            "tasks", records=batch_records, columns=IMPORT_COLUMNS
+        )
+        query_duration.observe(
+            time.perf_counter() - start_time, database="primary", operation="COPY"
+        )
+
+    # COPY идёт в обход SQLAlchemy, транзакция сессии уже открыта, поэтому
+    # asyncpg создаёт внутри неё SAVEPOINT.
+    async with driver_connection.transaction():  # pyright: ignore [reportOptionalMemberAccess]
+        async for line_number, record in records:
+            if isinstance(record, dict):
+                try:
+                    task = SAddTasks.model_validate(record)
+                except ValidationError as e:
+                    record = validation_error_message(e)
+                else:
+                    batch.append((user_id, task.name, task.description, "CREATED"))
+                    if len(batch) >= batch_size:
+                        await copy_batch(batch)
+                        imported += len(batch)
+                        batch = []
+                    continue
+
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({"line": line_number, "error": record})
+
+        if batch:
+            await copy_batch(batch)
+            imported += len(batch)
+
+    if imported:
+        TasksDAO.publish_changes(session, [user_id])
+
+    return {"imported": imported, "failed": failed, "errors": errors}
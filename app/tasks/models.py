@@ -3,7 +3,7 @@ import enum
 import uuid
 
 # THIRDPARTY
-from sqlalchemy import ForeignKey, Text, text
+from sqlalchemy import BigInteger, Computed, ForeignKey, Index, Text, text
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -18,8 +18,27 @@ class StatusEnum(enum.Enum):
     COMPLETED = "COMPLETED"
 
 
+ALLOWED_PREVIOUS_STATUSES = {
+    StatusEnum.WORKING: [StatusEnum.CREATED],
+    StatusEnum.COMPLETED: [StatusEnum.CREATED, StatusEnum.WORKING],
+}
+
+TASKS_SEARCH_CONFIG = "russian"
+
+
 class Tasks(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_user_id_uuid", "user_id", "uuid"),
+        Index("ix_tasks_user_id_status_uuid", "user_id", "status", "uuid"),
+        Index(
+            "ix_tasks_user_id_uuid_not_completed",
+            "user_id",
+            "uuid",
+            postgresql_where=text("status != 'COMPLETED'"),
+        ),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     uuid: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -35,3 +54,36 @@ class Tasks(Base):
     status: Mapped[StatusEnum] = mapped_column(
         postgresql.ENUM(StatusEnum), nullable=False
     )
+    # Версию строки увеличивает триггер при каждом UPDATE, из неё строится ETag.
+    version: Mapped[int] = mapped_column(nullable=False, server_default=text("1"))
+    # Поисковый вектор вычисляет сама база данных, в обычных запросах он не загружается.
+    search_vector: Mapped[str] = mapped_column(
+        postgresql.TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{TASKS_SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{TASKS_SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+
+class TaskStatusCounters(Base):
+    """Количество задач пользователя в каждом статусе.
+
+    Таблица поддерживается триггерами на tasks (см. миграцию 3bd0ce80223f),
+    поэтому счётчики обновляются в той же транзакции при любой вставке,
+    смене статуса или удалении задач, в том числе при импорте через COPY.
+    """
+
+    __tablename__ = "task_status_counters"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.uuid", ondelete="CASCADE"), primary_key=True
+    )
+    status: Mapped[StatusEnum] = mapped_column(
+        postgresql.ENUM(StatusEnum), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
@@ -1,20 +1,91 @@
 # STDLIB
-from typing import List
+import asyncio
+from functools import partial
+from typing import List, Literal, Optional, Union
+import uuid
 
 # THIRDPARTY
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
+from pydantic import TypeAdapter
 
 # FIRSTPARTY
-from app.database import DbSession
-from app.exceptions import NotTaskException, YouCanNotUpdateTaskException
-from app.tasks.dao import TasksDAO
-from app.tasks.models import StatusEnum
-from app.tasks.schemas import SAddTasks, STasks, SUpdateTasks
+from app.config import settings
+from app.database import DbSession, read_only
+from app.etag import etag_matches, make_etag, not_modified
+from app.exceptions import (
+    ImportTimeoutException,
+    IncorrectCursorException,
+    NotTaskException,
+    YouCanNotUpdateTaskException,
+)
+from app.pagination import decode_cursor, encode_cursor
+from app.tasks.cache import tasks_response_cache
+from app.tasks.dao import TASK_ROW_COLUMNS, TASK_VERSION_COLUMNS, TasksDAO
+from app.tasks.export import EXPORT_MEDIA_TYPES, stream_tasks_export
+from app.tasks.importer import import_tasks
+from app.tasks.models import ALLOWED_PREVIOUS_STATUSES, StatusEnum, Tasks
+from app.tasks.schemas import (
+    SAddTasks,
+    SBulkUpdateTasks,
+    STasks,
+    STasksImportResult,
+    STasksPage,
+    STasksStats,
+    STaskUpdateResult,
+    SUpdateTasks,
+    task_to_dict,
+)
 from app.users.dependencies import get_current_user
 from app.users.models import Users
 
 router = APIRouter(prefix="/tasks", tags=["Задачи"])
 
+STASKS_LIST = TypeAdapter(List[STasks])
+
+
+def tasks_etag(tasks) -> str:
+    """
+    Строит ETag по задачам ответа (экземплярам модели Tasks или строкам с полями uuid и version).
+    """
+    return make_etag((task.uuid, task.version) for task in tasks)
+
+
+def render_tasks(tasks) -> bytes:
+    """
+    Сериализует список задач в JSON так же, как его отдал бы FastAPI по модели List[STasks].
+
+    При включённой настройке FAST_JSON_RESPONSES задачи сериализуются через orjson без валидации.
+    """
+    if settings.FAST_JSON_RESPONSES:
+        return orjson.dumps([task_to_dict(task) for task in tasks])
+    return STASKS_LIST.dump_json(
+        STASKS_LIST.validate_python(tasks, from_attributes=True)
+    )
+
+
+def render_tasks_page(tasks, next_cursor: Optional[str]) -> bytes:
+    """
+    Сериализует страницу задач в JSON так же, как его отдал бы FastAPI по модели STasksPage.
+
+    При включённой настройке FAST_JSON_RESPONSES задачи сериализуются через orjson без валидации.
+    """
+    if settings.FAST_JSON_RESPONSES:
+        return orjson.dumps(
+            {
+                "items": [task_to_dict(task) for task in tasks],
+                "next_cursor": next_cursor,
+            }
+        )
+    return (
+        STasksPage.model_validate(
+            {"items": tasks, "next_cursor": next_cursor}, from_attributes=True
+        )
+        .model_dump_json()
+        .encode()
+    )
+
 
 @router.post("/create")
 async def create_task(
@@ -44,54 +115,349 @@ async def create_task(
     return new_task
 
 
+@router.post("/bulk")
+async def create_tasks(
+    session: DbSession,
+    new_tasks_data: List[SAddTasks] = Body(min_length=1, max_length=1000),
+    user: Users = Depends(get_current_user),
+) -> List[STasks]:
+    """
+    Добавляет несколько задач одним запросом к базе данных в одной транзакции.
+
+    Args:
+        session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
+        new_tasks_data: Список Pydantic моделей SAddTasks (не больше 1000), содержащих данные для добавления новых задач.
+        user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
+
+    Returns:
+        new_tasks: Список экземпляров Pydantic модели STasks, представляющий созданные задачи в порядке добавления.
+    """
+    new_tasks = await TasksDAO.add_many(
+        session=session,
+        values=[
+            {
+                "user_id": user.uuid,
+                "name": new_task_data.name,
+                "description": new_task_data.description,
+                "status": "CREATED",
+            }
+            for new_task_data in new_tasks_data
+        ],
+    )
+
+    return new_tasks
+
+
+@router.post("/import")
+async def import_tasks_file(
+    request: Request,
+    session: DbSession,
+    file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    user: Users = Depends(get_current_user),
+) -> STasksImportResult:
+    """
+    Загружает задачи из NDJSON или CSV, переданного в теле запроса.
+
+    Тело запроса читается потоком и не хранится в памяти целиком, корректные
+    строки записываются в базу данных через COPY пачками по TASKS_IMPORT_BATCH_SIZE.
+    Используются только поля name и description, остальные поля игнорируются.
+
+    Все пачки пишутся в транзакции запроса, а триггеры счётчиков статусов держат
+    блокировку строки счётчиков пользователя до её фиксации. Пока идёт загрузка, другие
+    записи задач этого пользователя ждут, поэтому загрузка (вместе с чтением тела)
+    ограничена TASKS_IMPORT_TIMEOUT секундами: по истечении транзакция откатывается
+    и отдаётся 408.
+
+    Args:
+        request: Request - Объект HTTP запроса, из которого читается тело.
+        session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
+        file_format: Формат загрузки - ndjson или csv (первая строка - заголовок).
+        user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
+
+    Returns:
+        import_result: Экземпляр Pydantic модели STasksImportResult с числом загруженных задач и ошибками по строкам.
+    """
+    try:
+        async with asyncio.timeout(settings.TASKS_IMPORT_TIMEOUT):
+            import_result = await import_tasks(
+                session=session,
+                user_id=user.uuid,
+                stream=request.stream(),
+                file_format=file_format,
+                batch_size=settings.TASKS_IMPORT_BATCH_SIZE,
+            )
+    except TimeoutError:
+        raise ImportTimeoutException
+
+    return STasksImportResult(**import_result)
+
+
 @router.get("/all")
+@read_only
 async def get_all_tasks(
+    request: Request,
     session: DbSession,
     page: int = Query(1, ge=1),
     page_size: int = Query(5, le=10, ge=5),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    status: Optional[List[Literal["CREATED", "WORKING", "COMPLETED"]]] = Query(None),
     user: Users = Depends(get_current_user),
-) -> List[STasks]:
+) -> Union[List[STasks], STasksPage]:
     """
     Отдаёт все задачи пользователя.
 
+    Если передан cursor, задачи отдаются постранично по курсору (keyset пагинация):
+    для первой страницы передаётся пустой cursor, для следующих - next_cursor
+    из предыдущего ответа. Иначе используется пагинация по номеру страницы.
+
     Args:
+        request: Запрос (нужен заголовок If-None-Match).
         session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
         page: Номер страницы, которую хочет получить пользователь.
         page_size: Размер страницы.
+        cursor: Курсор страницы, которую хочет получить пользователь.
+        limit: Размер страницы при пагинации по курсору.
+        status: Статусы задач, которые нужно отдать (по умолчанию - все).
         user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
 
     Returns:
         all_tasks: Список экземпляров Pydantic модели STasks, представляющий все задачи пользователя.
+        Либо экземпляр Pydantic модели STasksPage со страницей задач и курсором следующей страницы.
+
+    ETag ответа строится по UUID и версиям задач страницы. Если он совпадает с If-None-Match,
+    отдаётся 304 Not Modified: из базы читаются только UUID и версии, без загрузки задач.
+
+    Задачи читаются запросом Core (TASK_ROW_COLUMNS) как строки результата,
+    без создания экземпляров модели Tasks.
+
+    Готовые ответы кешируются по пользователю и параметрам запроса (tasks_response_cache),
+    кеш пользователя сбрасывается после фиксации любого изменения его задач.
+
+    При включённой настройке FAST_JSON_RESPONSES задачи сериализуются через orjson
+    без валидации Pydantic моделями.
     """
-    all_tasks = await TasksDAO.find_all_users_tasks(
-        session=session, user_id=str(user.uuid), page=page, page_size=page_size
+    if cursor is None:
+        find_tasks = partial(
+            TasksDAO.find_all_users_tasks,
+            session=session,
+            user_id=str(user.uuid),
+            page=page,
+            page_size=page_size,
+            statuses=status,
+        )
+    else:
+        after = None
+        if cursor:
+            (after,) = decode_cursor(cursor, size=1)
+            try:
+                uuid.UUID(after)
+            except (AttributeError, TypeError, ValueError):
+                raise IncorrectCursorException
+        find_tasks = partial(
+            TasksDAO.find_users_tasks_after,
+            session=session,
+            user_id=str(user.uuid),
+            after=after,
+            limit=limit + 1,
+            statuses=status,
+        )
+
+    cache_key = tasks_response_cache.key(
+        user.uuid, (page, page_size, cursor, limit, tuple(sorted(status or ())))
     )
+    if_none_match = request.headers.get("if-none-match")
+
+    cached = tasks_response_cache.get(cache_key)
+    if cached is not None:
+        body, etag = cached
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        return Response(body, media_type="application/json", headers={"ETag": etag})
+
+    if if_none_match:
+        etag = tasks_etag(await find_tasks(columns=TASK_VERSION_COLUMNS))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    tasks = await find_tasks(columns=TASK_ROW_COLUMNS)
+    etag = tasks_etag(tasks)
+
+    if cursor is None:
+        body = render_tasks(tasks)
+    else:
+        next_cursor = (
+            encode_cursor(str(tasks[limit - 1].uuid)) if len(tasks) > limit else None
+        )
+        body = render_tasks_page(tasks[:limit], next_cursor)
+
+    tasks_response_cache.set(cache_key, (body, etag))
 
-    return all_tasks
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/export")
+@read_only
+async def export_tasks(
+    file_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    user: Users = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Выгружает все задачи пользователя потоком в формате NDJSON или CSV.
+
+    Args:
+        file_format: Формат выгрузки - ndjson или csv.
+        user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
+
+    Returns:
+        StreamingResponse с задачами пользователя, отдаваемыми частями по TASKS_EXPORT_CHUNK_SIZE задач.
+    """
+    return StreamingResponse(
+        stream_tasks_export(
+            user_id=str(user.uuid),
+            file_format=file_format,
+            chunk_size=settings.TASKS_EXPORT_CHUNK_SIZE,
+        ),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{file_format}"'},
+    )
+
+
+@router.get("/search")
+@read_only
+async def search_tasks(
+    session: DbSession,
+    q: str = Query(min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    user: Users = Depends(get_current_user),
+) -> STasksPage:
+    """
+    Ищет задачи пользователя по названию и описанию.
+
+    Запрос разбирается функцией websearch_to_tsquery (поддерживаются кавычки, OR и минус),
+    задачи сортируются по релевантности, совпадения в названии весят больше, чем в описании.
+
+    Args:
+        session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
+        q: Поисковый запрос.
+        cursor: Курсор следующей страницы из предыдущего ответа (для первой страницы не передаётся).
+        limit: Размер страницы.
+        user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
+
+    Returns:
+        Экземпляр Pydantic модели STasksPage с найденными задачами и курсором следующей страницы.
+    """
+    after = None
+    if cursor:
+        after_rank, after_uuid = decode_cursor(cursor, size=2)
+        try:
+            uuid.UUID(after_uuid)
+            after = (float(after_rank), after_uuid)
+        except (AttributeError, TypeError, ValueError):
+            raise IncorrectCursorException
+
+    found_tasks = await TasksDAO.search_users_tasks(
+        session=session,
+        user_id=str(user.uuid),
+        query=q,
+        after=after,
+        limit=limit + 1,
+    )
+    next_cursor = None
+    if len(found_tasks) > limit:
+        last_task, last_rank = found_tasks[limit - 1]
+        next_cursor = encode_cursor(last_rank, str(last_task.uuid))
+
+    return STasksPage(
+        items=[STasks.model_validate(task) for task, _ in found_tasks[:limit]],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/stats")
+@read_only
+async def get_tasks_stats(
+    session: DbSession, user: Users = Depends(get_current_user)
+) -> STasksStats:
+    """
+    Отдаёт количество задач пользователя в каждом статусе.
+
+    Args:
+        session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
+        user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
+
+    Returns:
+        Экземпляр Pydantic модели STasksStats с количеством задач по статусам и общим количеством.
+
+    Значения читаются из таблицы task_status_counters, которую поддерживают триггеры на tasks,
+    поэтому запрос не зависит от количества задач пользователя.
+    """
+    stats = await TasksDAO.count_users_tasks_by_status(
+        session=session, user_id=str(user.uuid)
+    )
+
+    return STasksStats(**stats, total=sum(stats.values()))
 
 
 @router.get("/{task_id}")
+@read_only
 async def get_task(
-    session: DbSession, task_id: str, user: Users = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    session: DbSession,
+    task_id: str,
+    user: Users = Depends(get_current_user),
 ) -> STasks:
     """
     Отдаёт задачу по ID.
 
     Args:
+        request: Запрос (нужен заголовок If-None-Match).
+        response: Ответ, в который записывается заголовок ETag.
         session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
         task_id: ID задачи, которая должна быть получена.
         user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
 
     Returns:
         new_task: Экземпляр Pydantic модели STasks, представляющий задачу с указанным ID.
+
+    ETag ответа строится по UUID и версии задачи. Если он совпадает с If-None-Match,
+    отдаётся 304 Not Modified, а из базы читается только версия задачи.
+
+    Задача читается запросом Core (TASK_ROW_COLUMNS) без создания экземпляра модели Tasks.
+
+    При включённой настройке FAST_JSON_RESPONSES задача отдаётся через ORJSONResponse
+    без валидации Pydantic моделью STasks.
     """
-    task = await TasksDAO.find_one_or_none(
-        session=session, uuid=task_id, user_id=str(user.uuid)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        task_version = await TasksDAO.find_users_task_row(
+            session=session,
+            task_id=task_id,
+            user_id=str(user.uuid),
+            columns=TASK_VERSION_COLUMNS,
+        )
+        if task_version is None:
+            raise NotTaskException
+
+        etag = tasks_etag([task_version])
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    task = await TasksDAO.find_users_task_row(
+        session=session, task_id=task_id, user_id=str(user.uuid)
     )
 
     if not task:
         raise NotTaskException
 
+    etag = tasks_etag([task])
+
+    if settings.FAST_JSON_RESPONSES:
+        return ORJSONResponse(task_to_dict(task), headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return task
 
 
@@ -104,6 +470,9 @@ async def update_task_status(
     """
     Обновляет статус задачи.
 
+    Проверка владельца и допустимости смены статуса выполняется в том же
+    UPDATE запросе, что и само обновление.
+
     Args:
         session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
         update_task_data: Pydantic модель SUpdateTasks, содержащая данные для изменения статуса задачи.
@@ -112,24 +481,65 @@ async def update_task_status(
     Returns:
         updated_task: Экземпляр Pydantic модели STasks, представляющий задачу с обновлённым статусом.
     """
-    task = await TasksDAO.find_one_or_none(
-        session=session, uuid=update_task_data.task_id, user_id=str(user.uuid)
+    updated_task, found = await TasksDAO.conditional_update(
+        session=session,
+        filters={"uuid": update_task_data.task_id, "user_id": str(user.uuid)},
+        conditions=[
+            Tasks.status.in_(
+                ALLOWED_PREVIOUS_STATUSES[StatusEnum(update_task_data.status)]
+            )
+        ],
+        status=update_task_data.status,
     )
-    if not task:
+    if not found:
         raise NotTaskException
 
-    if (
-        task.status == StatusEnum.WORKING and update_task_data.status != "COMPLETED"
-    ) or task.status == StatusEnum.COMPLETED:
+    if not updated_task:
         raise YouCanNotUpdateTaskException
 
-    updated_task = await TasksDAO.update(
+    return updated_task
+
+
+@router.patch("/bulk")
+async def update_tasks_status(
+    session: DbSession,
+    update_tasks_data: SBulkUpdateTasks,
+    user: Users = Depends(get_current_user),
+) -> List[STaskUpdateResult]:
+    """
+    Обновляет статус нескольких задач одним запросом к базе данных.
+
+    Правила смены статуса те же, что и у update_task_status: CREATED -> WORKING,
+    CREATED -> COMPLETED и WORKING -> COMPLETED.
+
+    Args:
+        session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
+        update_tasks_data: Pydantic модель SBulkUpdateTasks, содержащая ID задач (не больше 1000) и новый статус.
+        user: Экземпляр модели Users, представляющий текущего пользователя, полученный через зависимость get_current_user().
+
+    Returns:
+        results: Список экземпляров Pydantic модели STaskUpdateResult с результатом для каждой задачи:
+        updated - статус обновлён, not_found - задачи нет, forbidden - смена статуса запрещена.
+    """
+    task_ids = list(dict.fromkeys(update_tasks_data.task_ids))
+    found_tasks = await TasksDAO.update_users_tasks_status(
         session=session,
-        model_id=update_task_data.task_id,
-        status=update_task_data.status,
+        user_id=str(user.uuid),
+        task_ids=task_ids,
+        status=update_tasks_data.status,
     )
 
-    return updated_task
+    results = []
+    for task_id in task_ids:
+        if task_id not in found_tasks:
+            result = "not_found"
+        elif found_tasks[task_id]:
+            result = "updated"
+        else:
+            result = "forbidden"
+        results.append(STaskUpdateResult(task_id=task_id, result=result))
+
+    return results
 
 
 @router.delete("/delete")
@@ -147,10 +557,8 @@ async def delete_task(
     Returns:
         None
     """
-    task = await TasksDAO.find_one_or_none(
-        session=session, uuid=task_id, user_id=str(user.uuid)
+    _, found = await TasksDAO.conditional_delete(
+        session=session, filters={"uuid": task_id, "user_id": str(user.uuid)}
     )
-    if not task:
+    if not found:
         raise NotTaskException
-
-    await TasksDAO.delete(session=session, uuid=task_id)
@@ -1,11 +1,14 @@
 # STDLIB
-from typing import Literal, Optional
+from typing import List, Literal, Optional
+import uuid
 
 # THIRDPARTY
-from pydantic import UUID4, BaseModel, Field
+from pydantic import UUID4, BaseModel, ConfigDict, Field
 
 
 class STasks(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     uuid: UUID4
     user_id: UUID4
     name: str
@@ -13,6 +16,27 @@ class STasks(BaseModel):
     status: str
 
 
+def task_to_dict(task) -> dict:
+    """
+    Переводит задачу (экземпляр модели Tasks или строку результата запроса)
+    в словарь с полями STasks без валидации Pydantic.
+
+    Используется в быстром пути ответа, где словарь сразу сериализуется orjson.
+    """
+    return {
+        "uuid": str(task.uuid),
+        "user_id": str(task.user_id),
+        "name": task.name,
+        "description": task.description,
+        "status": task.status.value,
+    }
+
+
+class STasksPage(BaseModel):
+    items: List[STasks]
+    next_cursor: Optional[str]
+
+
 class SAddTasks(BaseModel):
     name: str = Field(min_length=1, max_length=30)
     description: Optional[str] = Field(default=None, max_length=1000)
@@ -21,3 +45,31 @@ class SAddTasks(BaseModel):
 class SUpdateTasks(BaseModel):
     task_id: str
     status: Literal["WORKING", "COMPLETED"]
+
+
+class SBulkUpdateTasks(BaseModel):
+    task_ids: List[uuid.UUID] = Field(min_length=1, max_length=1000)
+    status: Literal["WORKING", "COMPLETED"]
+
+
+class STaskUpdateResult(BaseModel):
+    task_id: uuid.UUID
+    result: Literal["updated", "not_found", "forbidden"]
+
+
+class STasksStats(BaseModel):
+    CREATED: int
+    WORKING: int
+    COMPLETED: int
+    total: int
+
+
+class STasksImportError(BaseModel):
+    line: int
+    error: str
+
+
+class STasksImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[STasksImportError]
@@ -3,59 +3,66 @@ from datetime import UTC, datetime, timedelta
 
 # THIRDPARTY
 import jwt
-from passlib.context import CryptContext
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # FIRSTPARTY
 from app.config import settings
+from app.exceptions import IncorrectTokenFormatException, TokenExpiredException
+from app.users.cache import token_cache
 from app.users.dao import UsersDAO
+from app.users.hashing import check_password
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-
-def get_password_hash(password: str) -> str:
+def create_access_token(data: dict) -> str:
     """
-    Отдаёт хешированный пароль.
+    Создаёт JWT токен.
 
     Args:
-        password: Пароль, который должен быть захеширован.
+        data: Данные для создания JWT токена.
 
     Returns:
-        Захешированный пароль.
+        encoded_jwt: Созданный JWT токен.
     """
-    return pwd_context.hash(password)
+    to_encode = data.copy()
+    expire = datetime.now(UTC) + timedelta(minutes=60)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, settings.ALGORITHM)
+    return encoded_jwt
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def decode_access_token(token: str) -> dict:
     """
-    Сравнивает введённый пароль и хешированный пароль.
+    Проверяет JWT токен и отдаёт его содержимое.
+
+    Проверенные токены хранятся в кеше до истечения срока их действия (exp),
+    поэтому подпись одного и того же токена проверяется только один раз.
 
     Args:
-        plain_password: Введенный пароль.
-        hashed_password: Хешированный пароль для сравнения.
+        token: JWT токен.
 
     Returns:
-        True, если пароль правильный, False - если неправильный.
+        payload: Содержимое JWT токена.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
 
+    try:
+        payload = jwt.decode(
+            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+    except jwt.ExpiredSignatureError:
+        raise TokenExpiredException
+    except jwt.InvalidTokenError:
+        raise IncorrectTokenFormatException
 
-def create_access_token(data: dict) -> str:
-    """
-    Создаёт JWT токен.
-
-    Args:
-        data: Данные для создания JWT токена.
+    expire = payload.get("exp")
+    if not expire:
+        raise TokenExpiredException
 
-    Returns:
-        encoded_jwt: Созданный JWT токен.
-    """
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(minutes=60)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, settings.ALGORITHM)
-    return encoded_jwt
+    token_cache.set(token, payload, ttl=int(expire) - datetime.now(UTC).timestamp())
+    return payload
 
 
 async def authenticate_user(session: AsyncSession, email: EmailStr, password: str):
@@ -73,6 +80,6 @@ async def authenticate_user(session: AsyncSession, email: EmailStr, password: st
     auth_user = await UsersDAO.find_one_or_none(session=session, email=email)
     if not auth_user:
         return None
-    if not verify_password(password, auth_user.hashed_password):
+    if not await check_password(password, auth_user.hashed_password):
         return None
     return auth_user
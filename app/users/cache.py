@@ -0,0 +1,52 @@
+# STDLIB
+from typing import Optional
+
+# FIRSTPARTY
+from app.cache import TTLCache
+from app.config import settings
+from app.invalidation import invalidation_bus
+from app.users.models import Users
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.TOKEN_CACHE_TTL)
+
+
+def get_cached_user(user_id: str) -> Optional[Users]:
+    """
+    Отдаёт пользователя из кеша аутентифицированных пользователей.
+
+    Args:
+        user_id: ID пользователя.
+
+    Returns:
+        Экземпляр модели Users или None, если пользователя нет в кеше.
+    """
+    return principal_cache.get(str(user_id))
+
+
+def cache_user(user: Users) -> None:
+    """
+    Сохраняет пользователя в кеш аутентифицированных пользователей.
+
+    Args:
+        user: Экземпляр модели Users, отсоединённый от сессии.
+    """
+    principal_cache.set(str(user.uuid), user, ttl=invalidation_bus.cache_ttl())
+
+
+def invalidate_user(user_id) -> None:
+    """
+    Удаляет пользователя из кеша. Вызывается при изменении или удалении пользователя.
+
+    Args:
+        user_id: ID пользователя.
+    """
+    principal_cache.delete(str(user_id))
+
+
+invalidation_bus.register(
+    "users", invalidate=invalidate_user, clear=principal_cache.clear
+)
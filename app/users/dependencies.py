@@ -1,19 +1,11 @@
-# STDLIB
-from datetime import UTC, datetime
-
 # THIRDPARTY
 from fastapi import Depends, Request
-from jose import JWTError, jwt
 
 # FIRSTPARTY
-from app.config import settings
 from app.database import DbSession
-from app.exceptions import (
-    IncorrectTokenFormatException,
-    TokenAbsentException,
-    TokenExpiredException,
-    UserIsNotPresentException,
-)
+from app.exceptions import TokenAbsentException, UserIsNotPresentException
+from app.users.auth import decode_access_token
+from app.users.cache import cache_user, get_cached_user
 from app.users.dao import UsersDAO
 from app.users.models import Users
 
@@ -32,6 +24,9 @@ async def get_current_user(
     """
     Отдаёт текущего пользователя.
 
+    Пользователь сначала ищется в кеше аутентифицированных пользователей,
+    в базу данных запрос уходит только при промахе.
+
     Args:
         session: DbSession(AsyncSession) - Асинхронная сессия базы данных.
         token: Токен из куки файлов (access_token), полученный через зависимость get_token().
@@ -39,20 +34,18 @@ async def get_current_user(
     Returns:
         user: Экземпляр модели Users, представляющий текущего пользователя.
     """
-    try:
-        payload = jwt.decode(
-            token=token, key=settings.SECRET_KEY, algorithms=settings.ALGORITHM
-        )
-    except JWTError:
-        raise IncorrectTokenFormatException
-    expire: str = payload.get("exp")  # pyright: ignore [reportAssignmentType]
-    if (not expire) or int(expire) < datetime.now(UTC).timestamp():
-        raise TokenExpiredException
+    payload = decode_access_token(token)
     user_id: str = payload.get("sub")  # pyright: ignore [reportAssignmentType]
     if not user_id:
         raise UserIsNotPresentException
+    user = get_cached_user(user_id)
+    if user:
+        return user
+
     user = await UsersDAO.find_by_id(session=session, model_id=user_id)
     if not user:
         raise UserIsNotPresentException
+    session.expunge(user)
+    cache_user(user)
 
     return user
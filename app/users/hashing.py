@@ -0,0 +1,165 @@
+# STDLIB
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import time
+from typing import Callable, Optional
+
+# THIRDPARTY
+from passlib.context import CryptContext
+
+# FIRSTPARTY
+from app.config import settings
+from app.exceptions import PasswordHashingOverloadedException
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def get_password_hash(password: str) -> str:
+    """
+    Отдаёт хешированный пароль.
+
+    Args:
+        password: Пароль, который должен быть захеширован.
+
+    Returns:
+        Захешированный пароль.
+    """
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Сравнивает введённый пароль и хешированный пароль.
+
+    Args:
+        plain_password: Введенный пароль.
+        hashed_password: Хешированный пароль для сравнения.
+
+    Returns:
+        True, если пароль правильный, False - если неправильный.
+    """
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashExecutor:
+    """
+    Выполняет хеширование паролей в отдельном пуле потоков или процессов,
+    чтобы bcrypt не блокировал event loop.
+
+    Число одновременно ожидающих задач ограничено max_pending, при превышении
+    лимита запрос отклоняется с ошибкой 503.
+    """
+
+    def __init__(self, kind: str, max_workers: int, max_pending: int):
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.time_total = 0.0
+        self.time_max = 0.0
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def run(self, func: Callable, *args):
+        """
+        Выполняет функцию в пуле и ждёт результат, не блокируя event loop.
+
+        Args:
+            func: Функция хеширования или проверки пароля.
+            args: Аргументы функции.
+
+        Returns:
+            Результат выполнения функции.
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashingOverloadedException
+
+        self.pending += 1
+        start_time = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            hashing_time = time.perf_counter() - start_time
+            self.pending -= 1
+            self.completed += 1
+            self.time_total += hashing_time
+            self.time_max = max(self.time_max, hashing_time)
+
+    def shutdown(self) -> None:
+        """Останавливает пул, не дожидаясь завершения задач."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """
+        Отдаёт статистику работы пула хеширования.
+
+        Returns:
+            Словарь с типом пула, текущей и максимальной длиной очереди,
+            числом выполненных и отклонённых задач и временем их выполнения.
+        """
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "time_total": self.time_total,
+            "time_max": self.time_max,
+        }
+
+
+password_hash_executor = PasswordHashExecutor(
+    kind=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Хеширует пароль в пуле хеширования паролей.
+
+    Args:
+        password: Пароль, который должен быть захеширован.
+
+    Returns:
+        Захешированный пароль.
+    """
+    return await password_hash_executor.run(get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Сравнивает введённый пароль и хешированный пароль в пуле хеширования паролей.
+
+    Args:
+        plain_password: Введенный пароль.
+        hashed_password: Хешированный пароль для сравнения.
+
+    Returns:
+        True, если пароль правильный, False - если неправильный.
+    """
+    return await password_hash_executor.run(
+        verify_password, plain_password, hashed_password
+    )
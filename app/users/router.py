@@ -2,19 +2,16 @@
 from fastapi import APIRouter, Depends, Response
 
 # FIRSTPARTY
-from app.database import DbSession
+from app.database import DbSession, read_only
 from app.exceptions import (
     IncorrectUserEmailOrPasswordException,
     UserAlreadyExistsException,
 )
 from app.logger import logger
-from app.users.auth import (
-    authenticate_user,
-    create_access_token,
-    get_password_hash,
-)
+from app.users.auth import authenticate_user, create_access_token
 from app.users.dao import UsersDAO
 from app.users.dependencies import get_current_user
+from app.users.hashing import hash_password
 from app.users.models import Users
 from app.users.schemas import SUsersAuth
 
@@ -39,7 +36,7 @@ async def register(session: DbSession, user_data: SUsersAuth) -> None:
     if existing_user:
         raise UserAlreadyExistsException
 
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password(user_data.password)
 
     await UsersDAO.add(
         session=session, email=user_data.email, hashed_password=hashed_password
@@ -48,6 +45,7 @@ async def register(session: DbSession, user_data: SUsersAuth) -> None:
 
 
 @router.post("/login")
+@read_only
 async def login(response: Response, session: DbSession, user_data: SUsersAuth):
     """
     Аутентифицирует пользователя в системе.
@@ -75,6 +73,7 @@ async def login(response: Response, session: DbSession, user_data: SUsersAuth):
 
 
 @router.get("/me")
+@read_only
 async def get_me(user: Users = Depends(get_current_user)):
     """
     Выдаёт информацию пользователю о самом себе.
@@ -0,0 +1,507 @@
+"""
+Нагрузочный бенчмарк HTTP эндпоинтов с сохранённым эталоном (baseline).
+
+Бенчмарк создаёт в базе данных пользователей с задачами (--users, --tasks-per-user),
+затем для каждого эндпоинта роутеров auth и tasks запускает --concurrency асинхронных
+клиентов, каждый из которых делает --requests / --concurrency запросов от своего пользователя.
+Для эндпоинта считаются пропускная способность (запросов в секунду) и задержки p50/p95/p99.
+Читающие эндпоинты идут первыми, поэтому они работают с одинаковым набором данных.
+Перед сценариями смены статуса задачи пользователей возвращаются в статус CREATED,
+а сами сценарии переводят каждую задачу только по разрешённым переходам
+(CREATED -> WORKING -> COMPLETED), поэтому задач должно хватать на все запросы.
+
+По умолчанию приложение запускается в том же процессе (httpx.ASGITransport, с lifespan),
+с --base-url запросы уходят на запущенный сервер (uvicorn/gunicorn), настроенный на ту же
+базу данных. Нужна база данных с применёнными миграциями, созданные данные удаляются в конце.
+
+Результаты сравниваются с эталоном из --baseline: запуск завершается с кодом 1, если
+p50/p95 какого-либо эндпоинта выросли или пропускная способность упала больше чем на
+--threshold (по умолчанию 20%), а также если эндпоинт отвечал ошибками.
+Эталон записывается (или перезаписывается) с --save и имеет смысл только для той машины
+и тех параметров запуска, на которых он снят.
+
+Запуск:
+    python -m benchmarks.load --save
+    python -m benchmarks.load
+    python -m benchmarks.load --endpoints tasks_all,auth_login --requests 500
+"""
+
+# STDLIB
+import argparse
+import asyncio
+from contextlib import AsyncExitStack
+import json
+import math
+import os
+import sys
+import time
+from typing import Awaitable, Callable, Optional
+import uuid
+
+# THIRDPARTY
+import httpx
+from sqlalchemy import delete, insert, select, update
+
+# FIRSTPARTY
+from app.database import SessionLocal, engine
+from app.main import app as fastapi_app
+from app.tasks.dao import TasksDAO
+from app.tasks.models import Tasks
+from app.users.hashing import get_password_hash
+from app.users.models import Users
+
+PASSWORD = "benchmark"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baselines", "load.json")
+COMPARED_METRICS = ("p50", "p95")
+BULK_UPDATE_SIZE = 10
+# Сценарии смены статуса и число задач, которые меняет один их запрос.
+STATUS_UPDATE_SCENARIOS = {"tasks_update": 1, "tasks_bulk_update": BULK_UPDATE_SIZE}
+NEXT_STATUS = {"CREATED": "WORKING", "WORKING": "COMPLETED"}
+
+
+class BenchUser:
+    """Пользователь бенчмарка: клиент с его cookie, ID его задач и их статусы."""
+
+    def __init__(self, email: str, client: httpx.AsyncClient, task_ids: list[str]):
+        self.email = email
+        self.client = client
+        self.task_ids = task_ids
+        self.statuses = dict.fromkeys(task_ids, "CREATED")
+        self.created_ids: list[str] = []
+        self.requests = 0
+
+    def next_task_id(self) -> str:
+        self.requests += 1
+        return self.task_ids[self.requests % len(self.task_ids)]
+
+    def next_status_update(self, count: int) -> tuple[list[str], str]:
+        """
+        Выбирает count задач в одном статусе и разрешённый для них новый статус.
+
+        Новый статус отмечается сразу, поэтому параллельные клиенты того же
+        пользователя не выбирают те же задачи.
+
+        Returns:
+            ID задач и их новый статус.
+        """
+        for status, new_status in NEXT_STATUS.items():
+            task_ids = [
+                task_id
+                for task_id, current in self.statuses.items()
+                if current == status
+            ][:count]
+            if len(task_ids) == count:
+                break
+        else:
+            raise RuntimeError(f"No tasks left to update for {self.email}")
+
+        for task_id in task_ids:
+            self.statuses[task_id] = new_status
+        return task_ids, new_status
+
+
+Scenario = Callable[[BenchUser], Awaitable[httpx.Response]]
+
+
+async def auth_register(user: BenchUser) -> httpx.Response:
+    user.requests += 1
+    email = f"new-{uuid.uuid4().hex[:12]}@{user.email.split('@')[1]}"
+    return await user.client.post(
+        "/auth/register", json={"email": email, "password": PASSWORD}
+    )
+
+
+async def auth_login(user: BenchUser) -> httpx.Response:
+    return await user.client.post(
+        "/auth/login", json={"email": user.email, "password": PASSWORD}
+    )
+
+
+async def auth_me(user: BenchUser) -> httpx.Response:
+    return await user.client.get("/auth/me")
+
+
+async def tasks_all(user: BenchUser) -> httpx.Response:
+    return await user.client.get("/tasks/all", params={"page": 1, "page_size": 10})
+
+
+async def tasks_all_cursor(user: BenchUser) -> httpx.Response:
+    return await user.client.get("/tasks/all", params={"cursor": "", "limit": 100})
+
+
+async def tasks_get(user: BenchUser) -> httpx.Response:
+    return await user.client.get(f"/tasks/{user.next_task_id()}")
+
+
+async def tasks_search(user: BenchUser) -> httpx.Response:
+    return await user.client.get("/tasks/search", params={"q": "задача отчёт"})
+
+
+async def tasks_stats(user: BenchUser) -> httpx.Response:
+    return await user.client.get("/tasks/stats")
+
+
+async def tasks_export(user: BenchUser) -> httpx.Response:
+    return await user.client.get("/tasks/export", params={"format": "ndjson"})
+
+
+async def tasks_create(user: BenchUser) -> httpx.Response:
+    response = await user.client.post(
+        "/tasks/create", params={"name": "Новая задача", "description": "Описание"}
+    )
+    if response.status_code == 200:
+        user.created_ids.append(response.json()["uuid"])
+    return response
+
+
+async def tasks_bulk_create(user: BenchUser) -> httpx.Response:
+    return await user.client.post(
+        "/tasks/bulk",
+        json=[{"name": f"Задача {i}", "description": "Описание"} for i in range(20)],
+    )
+
+
+async def tasks_import(user: BenchUser) -> httpx.Response:
+    body = "".join(
+        json.dumps({"name": f"Импорт {i}", "description": "Описание"}) + "\n"
+        for i in range(100)
+    )
+    return await user.client.post(
+        "/tasks/import", params={"format": "ndjson"}, content=body.encode()
+    )
+
+
+async def tasks_update(user: BenchUser) -> httpx.Response:
+    (task_id,), status = user.next_status_update(1)
+    return await user.client.patch(
+        "/tasks/update", params={"task_id": task_id, "status": status}
+    )
+
+
+async def tasks_bulk_update(user: BenchUser) -> httpx.Response:
+    task_ids, status = user.next_status_update(BULK_UPDATE_SIZE)
+    return await user.client.patch(
+        "/tasks/bulk", json={"task_ids": task_ids, "status": status}
+    )
+
+
+async def tasks_delete(user: BenchUser) -> httpx.Response:
+    task_id = user.created_ids.pop() if user.created_ids else str(uuid.uuid4())
+    return await user.client.delete("/tasks/delete", params={"task_id": task_id})
+
+
+async def auth_logout(user: BenchUser) -> httpx.Response:
+    return await user.client.post("/auth/logout")
+
+
+# Порядок важен: чтения идут до записей, tasks_delete удаляет задачи из tasks_create,
+# auth_logout последний, потому что сбрасывает cookie клиента.
+SCENARIOS: dict[str, Scenario] = {
+    "auth_me": auth_me,
+    "tasks_all": tasks_all,
+    "tasks_all_cursor": tasks_all_cursor,
+    "tasks_get": tasks_get,
+    "tasks_search": tasks_search,
+    "tasks_stats": tasks_stats,
+    "tasks_export": tasks_export,
+    "auth_login": auth_login,
+    "auth_register": auth_register,
+    "tasks_create": tasks_create,
+    "tasks_bulk_create": tasks_bulk_create,
+    "tasks_import": tasks_import,
+    "tasks_update": tasks_update,
+    "tasks_bulk_update": tasks_bulk_update,
+    "tasks_delete": tasks_delete,
+    "auth_logout": auth_logout,
+}
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Отдаёт перцентиль q (0..1) отсортированных значений методом ближайшего ранга."""
+    index = max(math.ceil(q * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+async def run_scenario(
+    scenario: Scenario, users: list[BenchUser], concurrency: int, requests: int
+) -> dict:
+    """
+    Запускает concurrency клиентов, каждый делает requests / concurrency запросов.
+
+    Returns:
+        Словарь с числом запросов и ошибок, пропускной способностью (запросов в секунду)
+        и задержками mean/p50/p95/p99 в миллисекундах.
+    """
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(user: BenchUser, count: int) -> None:
+        nonlocal errors
+        for _ in range(count):
+            start_time = time.perf_counter()
+            response = await scenario(user)
+            latencies.append(time.perf_counter() - start_time)
+            if response.status_code >= 400:
+                errors += 1
+
+    per_worker = max(requests // concurrency, 1)
+    start_time = time.perf_counter()
+    await asyncio.gather(
+        *(worker(users[i % len(users)], per_worker) for i in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput": len(latencies) / elapsed,
+        "mean": sum(latencies) / len(latencies) * 1000,
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def seed(domain: str, users: int, tasks_per_user: int) -> list[tuple]:
+    """
+    Создаёт пользователей с паролем PASSWORD и их задачи.
+
+    Returns:
+        Пары (email, ID задач пользователя).
+    """
+    hashed_password = get_password_hash(PASSWORD)
+    seeded = []
+    async with SessionLocal() as session:
+        for number in range(users):
+            user_id = uuid.uuid4()
+            email = f"user-{number}@{domain}"
+            await session.execute(
+                insert(Users).values(
+                    uuid=user_id, email=email, hashed_password=hashed_password
+                )
+            )
+            task_ids = await session.scalars(
+                insert(Tasks).returning(Tasks.uuid),
+                [
+                    {
+                        "user_id": user_id,
+                        "name": f"Задача {i}",
+                        "description": f"Подготовить отчёт номер {i} по проекту",
+                        "status": "CREATED",
+                    }
+                    for i in range(tasks_per_user)
+                ],
+            )
+            seeded.append((email, [str(task_id) for task_id in task_ids]))
+        await session.commit()
+    return seeded
+
+
+async def reset_statuses(users: list[BenchUser]) -> None:
+    """Возвращает задачи пользователей бенчмарка в статус CREATED."""
+    async with SessionLocal() as session:
+        result = await session.execute(
+            update(Tasks)
+            .where(Tasks.uuid.in_([i for user in users for i in user.task_ids]))
+            .values(status="CREATED")
+            .returning(Tasks.user_id)
+        )
+        TasksDAO.publish_changes(session, set(result.scalars()))
+        await session.commit()
+    for user in users:
+        user.statuses = dict.fromkeys(user.task_ids, "CREATED")
+
+
+def check_status_updates(names: list[str], args: argparse.Namespace) -> None:
+    """
+    Проверяет, что задач пользователя хватит на все запросы сценариев смены статуса.
+
+    Каждую задачу можно обновить два раза (CREATED -> WORKING -> COMPLETED).
+    """
+    workers_per_user = math.ceil(args.concurrency / args.users)
+    per_worker = max(args.requests // args.concurrency, 1)
+    for name in names:
+        tasks_per_request = STATUS_UPDATE_SCENARIOS.get(name)
+        if tasks_per_request is None:
+            continue
+        requests = per_worker * workers_per_user + args.warmup
+        if requests * tasks_per_request > 2 * args.tasks_per_user:
+            raise SystemExit(
+                f"{name} needs {requests * tasks_per_request} status updates per user, "
+                f"--tasks-per-user {args.tasks_per_user} allows "
+                f"{2 * args.tasks_per_user}"
+            )
+
+
+async def cleanup(domain: str) -> None:
+    """Удаляет пользователей бенчмарка (в том числе созданных auth_register) и их задачи."""
+    async with SessionLocal() as session:
+        user_ids = select(Users.uuid).where(Users.email.endswith(f"@{domain}"))
+        await session.execute(delete(Tasks).where(Tasks.user_id.in_(user_ids)))
+        await session.execute(delete(Users).where(Users.email.endswith(f"@{domain}")))
+        await session.commit()
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Сравнивает результаты с эталоном.
+
+    Returns:
+        Описания регрессий: выросшие p50/p95 и упавшая пропускная способность
+        больше чем на threshold, а также эндпоинты, отвечавшие ошибками.
+    """
+    regressions = []
+    for name, result in results.items():
+        if result["errors"]:
+            regressions.append(f"{name}: {result['errors']} error responses")
+
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if result[metric] > base[metric] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.2f} ms > "
+                    f"baseline {base[metric]:.2f} ms (threshold {threshold:.0%})"
+                )
+        if result["throughput"] < base["throughput"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {result['throughput']:.1f} req/s < "
+                f"baseline {base['throughput']:.1f} req/s (threshold {threshold:.0%})"
+            )
+    return regressions
+
+
+def print_results(results: dict, baseline: dict) -> None:
+    print(
+        f"{'endpoint':<18} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'errors':>6}  vs baseline (req/s, p95)"
+    )
+    for name, result in results.items():
+        line = (
+            f"{name:<18} {result['throughput']:9.1f} {result['p50']:8.2f} "
+            f"{result['p95']:8.2f} {result['p99']:8.2f} {result['errors']:6}"
+        )
+        base = baseline.get(name)
+        if base:
+            line += (
+                f"  {result['throughput'] / base['throughput'] - 1:+7.1%}"
+                f" {result['p95'] / base['p95'] - 1:+7.1%}"
+            )
+        print(line)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    names = args.endpoints.split(",") if args.endpoints else list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+    check_status_updates(names, args)
+
+    domain = f"load-{uuid.uuid4().hex[:8]}.example.com"
+    seeded = await seed(domain, args.users, args.tasks_per_user)
+    results = {}
+    try:
+        async with AsyncExitStack() as stack:
+            if args.base_url:
+                transport = httpx.AsyncHTTPTransport()
+                base_url = args.base_url
+            else:
+                await stack.enter_async_context(
+                    fastapi_app.router.lifespan_context(fastapi_app)
+                )
+                transport = httpx.ASGITransport(app=fastapi_app)
+                base_url = "http://bench"
+
+            users = []
+            for email, task_ids in seeded:
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(
+                        base_url=base_url, transport=transport, timeout=60
+                    )
+                )
+                user = BenchUser(email, client, task_ids)
+                response = await auth_login(user)
+                response.raise_for_status()
+                users.append(user)
+
+            for name in names:
+                scenario = SCENARIOS[name]
+                if name in STATUS_UPDATE_SCENARIOS:
+                    await reset_statuses(users)
+                for user in users[: args.concurrency]:
+                    for _ in range(args.warmup):
+                        await scenario(user)
+                results[name] = await run_scenario(
+                    scenario, users, args.concurrency, args.requests
+                )
+                print(f"{name}: {results[name]['throughput']:.1f} req/s", flush=True)
+    finally:
+        await cleanup(domain)
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочный бенчмарк HTTP эндпоинтов")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--tasks-per-user", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=200, help="на эндпоинт")
+    parser.add_argument("--warmup", type=int, default=5, help="запросов на клиента")
+    parser.add_argument("--endpoints", help="через запятую, по умолчанию все")
+    parser.add_argument("--base-url", help="адрес запущенного сервера")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--save", action="store_true", help="записать эталон")
+    args = parser.parse_args()
+
+    config = {
+        "users": args.users,
+        "tasks_per_user": args.tasks_per_user,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "target": args.base_url or "asgi",
+    }
+    baseline: Optional[dict] = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    comparable = baseline is not None and baseline["config"] == config
+    baseline_endpoints = baseline["endpoints"] if baseline and comparable else {}
+
+    results = asyncio.run(run(args))
+    print()
+    print_results(results, baseline_endpoints)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(
+                {"config": config, "endpoints": {**baseline_endpoints, **results}},
+                file,
+                indent=2,
+            )
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}, run with --save to record one")
+        return
+    if not comparable:
+        sys.exit(
+            f"\nBaseline was recorded with {baseline['config']}, this run is {config}"
+        )
+
+    regressions = compare(results, baseline_endpoints, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        print("\n".join(f"  {regression}" for regression in regressions))
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
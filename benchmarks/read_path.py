@@ -0,0 +1,118 @@
+"""
+Бенчмарк пути чтения задач: ORM (экземпляры Tasks) и Core (строки TASK_ROW_COLUMNS).
+
+Для каждого размера страницы задачи читаются так же, как в /tasks/all (курсорная
+пагинация) и переводятся в словари task_to_dict. Замеряются время запроса и CPU
+процесса приложения на строку, а также память результата запроса на строку (tracemalloc).
+Нужна база данных с применёнными миграциями: бенчмарк создаёт временного
+пользователя с задачами и удаляет его в конце.
+
+Запуск:
+    python -m benchmarks.read_path
+"""
+
+# STDLIB
+import asyncio
+import time
+import tracemalloc
+import uuid
+
+# THIRDPARTY
+from sqlalchemy import delete, insert
+
+# FIRSTPARTY
+from app.database import ReadOnlySessionLocal, SessionLocal, engine
+from app.tasks.dao import TASK_ROW_COLUMNS, TasksDAO
+from app.tasks.models import Tasks
+from app.tasks.schemas import task_to_dict
+from app.users.models import Users
+
+REPEATS = 200
+PAGE_SIZES = (10, 100, 500)
+
+
+async def read_page(user_id: str, limit: int, columns) -> list[dict]:
+    async with ReadOnlySessionLocal() as session:
+        tasks = await TasksDAO.find_users_tasks_after(
+            session=session, user_id=user_id, after=None, limit=limit, columns=columns
+        )
+        return [task_to_dict(task) for task in tasks]
+
+
+async def result_memory(user_id: str, limit: int, columns) -> int:
+    """
+    Отдаёт память, которую занимает результат запроса страницы, пока открыта сессия
+    (экземпляры Tasks с их состоянием в identity map или строки Row).
+    """
+    async with ReadOnlySessionLocal() as session:
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        tasks = await TasksDAO.find_users_tasks_after(
+            session=session, user_id=user_id, after=None, limit=limit, columns=columns
+        )
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del tasks
+    return after - before
+
+
+async def measure(user_id: str, limit: int, columns) -> tuple[float, float, float]:
+    """
+    Отдаёт время, CPU процесса и память результата на одну строку (мкс, мкс, байты).
+    """
+    for _ in range(5):
+        await read_page(user_id, limit, columns)
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    for _ in range(REPEATS):
+        await read_page(user_id, limit, columns)
+    wall = (time.perf_counter() - wall_start) / REPEATS / limit
+    cpu = (time.process_time() - cpu_start) / REPEATS / limit
+
+    memory = await result_memory(user_id, limit, columns)
+
+    return wall * 1e6, cpu * 1e6, memory / limit
+
+
+async def main() -> None:
+    user_id = uuid.uuid4()
+    async with SessionLocal() as session:
+        await session.execute(
+            insert(Users).values(
+                uuid=user_id, email=f"{user_id}@bench.local", hashed_password=""
+            )
+        )
+        await session.execute(
+            insert(Tasks),
+            [
+                {
+                    "user_id": user_id,
+                    "name": f"Задача {i}",
+                    "description": "Описание задачи " * 5,
+                    "status": "WORKING",
+                }
+                for i in range(max(PAGE_SIZES))
+            ],
+        )
+        await session.commit()
+
+    try:
+        for limit in PAGE_SIZES:
+            orm = await measure(str(user_id), limit, columns=None)
+            core = await measure(str(user_id), limit, columns=TASK_ROW_COLUMNS)
+            print(
+                f"{limit:>4} rows  "
+                f"orm: {orm[0]:6.1f} us/row {orm[1]:6.1f} cpu us/row {orm[2]:7.0f} B/row  "
+                f"core: {core[0]:6.1f} us/row {core[1]:6.1f} cpu us/row {core[2]:7.0f} B/row  "
+                f"cpu speedup: {orm[1] / core[1]:4.2f}x"
+            )
+    finally:
+        async with SessionLocal() as session:
+            await session.execute(delete(Tasks).where(Tasks.user_id == user_id))
+            await session.execute(delete(Users).where(Users.uuid == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
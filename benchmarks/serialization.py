@@ -0,0 +1,124 @@
+"""
+Микро-бенчмарк сериализации ответов с задачами.
+
+Сравнивает стандартный путь и быстрый путь (FAST_JSON_RESPONSES, task_to_dict и orjson)
+так же, как их выполняют эндпоинты: для /tasks/all вызываются render_tasks
+и render_tasks_page роутера с выключенной и включённой настройкой, для /tasks/{task_id} -
+сериализация FastAPI моделью ответа STasks и JSONResponse против ORJSONResponse.
+Задачи передаются строками результата запроса (TASK_ROW_COLUMNS), как их читает DAO.
+База данных не нужна, но переменные окружения для Settings должны быть заданы.
+
+Запуск:
+    python -m benchmarks.serialization
+"""
+
+# STDLIB
+import asyncio
+from typing import Callable
+import timeit
+import uuid
+
+# THIRDPARTY
+from asyncpg.pgproto.pgproto import UUID
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy.engine import IteratorResult, Row
+from sqlalchemy.engine.result import SimpleResultMetaData
+
+# FIRSTPARTY
+from app.config import settings
+from app.main import app
+from app.tasks.dao import TASK_ROW_COLUMNS
+from app.tasks.models import StatusEnum
+from app.tasks.router import render_tasks, render_tasks_page
+from app.tasks.schemas import task_to_dict
+
+NUMBER = 2000
+
+
+def make_rows(count: int) -> list[Row]:
+    """
+    Создаёт строки результата запроса с колонками TASK_ROW_COLUMNS без базы данных.
+
+    UUID создаются тем же типом, что отдаёт asyncpg при чтении из базы.
+    """
+    user_id = UUID(str(uuid.uuid4()))
+    metadata = SimpleResultMetaData([column.name for column in TASK_ROW_COLUMNS])
+    values = [
+        (
+            UUID(str(uuid.uuid4())),
+            user_id,
+            f"Задача {i}",
+            "Описание задачи " * 5,
+            StatusEnum.WORKING,
+            1,
+        )
+        for i in range(count)
+    ]
+    return list(IteratorResult(metadata, iter(values)).all())
+
+
+def get_route(path: str) -> APIRoute:
+    return next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path == path
+    )
+
+
+def with_fast_responses(enabled: bool, render: Callable[[], bytes]) -> Callable:
+    def run() -> bytes:
+        settings.FAST_JSON_RESPONSES = enabled
+        return render()
+
+    return run
+
+
+def bench(name: str, default_path: Callable, fast_path: Callable) -> None:
+    default_time = timeit.timeit(default_path, number=NUMBER) / NUMBER
+    fast_time = timeit.timeit(fast_path, number=NUMBER) / NUMBER
+
+    print(
+        f"{name:<30} default: {default_time * 1e6:9.1f} us  "
+        f"fast: {fast_time * 1e6:9.1f} us  "
+        f"speedup: {default_time / fast_time:5.2f}x"
+    )
+
+
+def main() -> None:
+    fast_json_responses = settings.FAST_JSON_RESPONSES
+    loop = asyncio.new_event_loop()
+    route = get_route("/tasks/{task_id}")
+    (row,) = make_rows(1)
+
+    def default_task() -> bytes:
+        serialized = loop.run_until_complete(
+            serialize_response(field=route.response_field, response_content=row)
+        )
+        return JSONResponse(serialized).body
+
+    try:
+        bench(
+            "/tasks/{task_id}",
+            default_task,
+            lambda: ORJSONResponse(task_to_dict(row)).body,
+        )
+        for count in (10, 100, 500):
+            rows = make_rows(count)
+            bench(
+                f"/tasks/all ({count} tasks)",
+                with_fast_responses(False, lambda: render_tasks(rows)),
+                with_fast_responses(True, lambda: render_tasks(rows)),
+            )
+            bench(
+                f"/tasks/all?cursor ({count} tasks)",
+                with_fast_responses(False, lambda: render_tasks_page(rows, None)),
+                with_fast_responses(True, lambda: render_tasks_page(rows, None)),
+            )
+    finally:
+        settings.FAST_JSON_RESPONSES = fast_json_responses
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
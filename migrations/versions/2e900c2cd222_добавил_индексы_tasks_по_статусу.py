@@ -0,0 +1,57 @@
+"""Добавил индексы tasks по статусу
+
+Revision ID: 2e900c2cd222
+Revises: ff32a01d7f19
+Create Date: 2026-10-18 16:27:14.844001
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e900c2cd222'
+down_revision: Union[str, Sequence[str], None] = 'ff32a01d7f19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id_status_uuid',
+            'tasks',
+            ['user_id', 'status', 'uuid'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_tasks_user_id_uuid_not_completed',
+            'tasks',
+            ['user_id', 'uuid'],
+            unique=False,
+            postgresql_where=sa.text("status != 'COMPLETED'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_user_id_uuid_not_completed',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_tasks_user_id_status_uuid',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
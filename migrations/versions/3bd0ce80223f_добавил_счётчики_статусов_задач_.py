@@ -0,0 +1,110 @@
+"""Добавил счётчики статусов задач пользователей
+
+Revision ID: 3bd0ce80223f
+Revises: 2e900c2cd222
+Create Date: 2026-10-18 16:43:08.817043
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3bd0ce80223f'
+down_revision: Union[str, Sequence[str], None] = '2e900c2cd222'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Триггеры уровня оператора с переходными таблицами: один пересчёт на весь
+# INSERT/UPDATE/DELETE (в том числе COPY при импорте), а не на каждую строку.
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION apply_task_status_counters() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_status_counters (user_id, status, count)
+        SELECT user_id, status, count(*) FROM new_rows
+        GROUP BY user_id, status
+        ORDER BY user_id, status
+        ON CONFLICT (user_id, status)
+        DO UPDATE SET count = task_status_counters.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO task_status_counters (user_id, status, count)
+        SELECT user_id, status, -count(*) FROM old_rows
+        GROUP BY user_id, status
+        ORDER BY user_id, status
+        ON CONFLICT (user_id, status)
+        DO UPDATE SET count = task_status_counters.count + EXCLUDED.count;
+    ELSE
+        INSERT INTO task_status_counters (user_id, status, count)
+        SELECT user_id, status, sum(delta) FROM (
+            SELECT user_id, status, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT user_id, status, -1 AS delta FROM old_rows
+        ) AS deltas
+        GROUP BY user_id, status
+        HAVING sum(delta) <> 0
+        ORDER BY user_id, status
+        ON CONFLICT (user_id, status)
+        DO UPDATE SET count = task_status_counters.count + EXCLUDED.count;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+TRIGGERS = {
+    "tasks_status_counters_insert": (
+        "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows"
+    ),
+    "tasks_status_counters_update": (
+        "AFTER UPDATE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "tasks_status_counters_delete": (
+        "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'task_status_counters',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column(
+            'status',
+            postgresql.ENUM(
+                'CREATED', 'WORKING', 'COMPLETED', name='statusenum', create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.uuid'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'status'),
+    )
+    # Блокируем запись в tasks до конца миграции, чтобы начальные значения
+    # счётчиков и включение триггеров видели одно и то же состояние таблицы.
+    op.execute("LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE")
+    op.execute(APPLY_FUNCTION)
+    for name, definition in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {definition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION apply_task_status_counters()"
+        )
+    op.execute(
+        "INSERT INTO task_status_counters (user_id, status, count) "
+        "SELECT user_id, status, count(*) FROM tasks GROUP BY user_id, status"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS apply_task_status_counters()")
+    op.drop_table('task_status_counters')
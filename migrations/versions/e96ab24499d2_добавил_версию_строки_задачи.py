@@ -0,0 +1,51 @@
+"""Добавил версию строки задачи
+
+Revision ID: e96ab24499d2
+Revises: 2cd4b41d12b2
+Create Date: 2026-10-18 16:48:48.714586
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e96ab24499d2'
+down_revision: Union[str, Sequence[str], None] = '2cd4b41d12b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Версию увеличивает триггер, поэтому она меняется при любом UPDATE задачи,
+# в том числе при массовых и условных обновлениях в обход ORM.
+BUMP_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_task_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.version := OLD.version + 1;
+    RETURN NEW;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'tasks',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+    )
+    op.execute(BUMP_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER tasks_bump_version BEFORE UPDATE ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION bump_task_version()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS tasks_bump_version ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS bump_task_version()")
+    op.drop_column('tasks', 'version')
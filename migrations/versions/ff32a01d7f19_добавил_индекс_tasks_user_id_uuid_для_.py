@@ -0,0 +1,41 @@
+"""Добавил индекс tasks (user_id, uuid) для пагинации
+
+Revision ID: ff32a01d7f19
+Revises: 2bfeff22d049
+Create Date: 2026-10-18 16:24:36.298720
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ff32a01d7f19'
+down_revision: Union[str, Sequence[str], None] = '2bfeff22d049'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id_uuid',
+            'tasks',
+            ['user_id', 'uuid'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_user_id_uuid',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,150 @@
+# THIRDPARTY
+from httpx import AsyncClient
+import pytest
+
+# FIRSTPARTY
+from app.config import settings
+from app.users.models import Users
+
+MONITORING_TOKEN = "monitoring-secret"
+
+
+@pytest.fixture
+def monitoring_headers(monkeypatch: pytest.MonkeyPatch) -> dict:
+    """Задаёт MONITORING_TOKEN и отдаёт заголовки запроса к /monitoring."""
+    monkeypatch.setattr(settings, "MONITORING_TOKEN", MONITORING_TOKEN)
+    return {"Authorization": f"Bearer {MONITORING_TOKEN}"}
+
+
+class TestMonitoringAPI:
+    @pytest.mark.parametrize(
+        "token, headers",
+        [
+            ("", {}),
+            ("", {"Authorization": "Bearer "}),
+            (MONITORING_TOKEN, {}),
+            (MONITORING_TOKEN, {"Authorization": "Bearer wrong"}),
+            (MONITORING_TOKEN, {"Authorization": MONITORING_TOKEN}),
+        ],
+    )
+    async def test_monitoring_access_denied(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        token: str,
+        headers: dict,
+    ):
+        monkeypatch.setattr(settings, "MONITORING_TOKEN", token)
+
+        response = await authenticated_ac.get("/monitoring/pool", headers=headers)
+
+        assert response.status_code == 403
+
+    async def test_get_pool(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monitoring_headers: dict,
+    ):
+        response = await authenticated_ac.get(
+            "/monitoring/pool", headers=monitoring_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["pool_class"]
+        assert response.json()["checkouts"] >= 1
+
+    async def test_get_cache(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monitoring_headers: dict,
+    ):
+        await authenticated_ac.get("/auth/me")
+        await authenticated_ac.get("/auth/me")
+
+        response = await authenticated_ac.get(
+            "/monitoring/cache", headers=monitoring_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["principals"]["hits"] >= 1
+        assert "tasks_responses" in response.json()
+
+    async def test_get_hashing(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monitoring_headers: dict,
+    ):
+        response = await authenticated_ac.get(
+            "/monitoring/hashing", headers=monitoring_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["completed"] >= 1
+
+    async def test_get_invalidation(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monitoring_headers: dict,
+    ):
+        await authenticated_ac.post("/tasks/create", params={"name": "Задача"})
+
+        response = await authenticated_ac.get(
+            "/monitoring/invalidation", headers=monitoring_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["published"] >= 1
+
+    async def test_get_statements(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monitoring_headers: dict,
+    ):
+        for _ in range(2):
+            await authenticated_ac.get("/tasks/all")
+            await authenticated_ac.get("/auth/me")
+
+        response = await authenticated_ac.get(
+            "/monitoring/statements", headers=monitoring_headers
+        )
+
+        assert response.status_code == 200
+        for cache in ("dao", "compiled", "prepared"):
+            assert response.json()[cache]["hits"] >= 1
+            assert 0 < response.json()[cache]["hit_rate"] <= 1
+
+    async def test_get_metrics(self, create_user: Users, authenticated_ac: AsyncClient):
+        await authenticated_ac.get("/tasks/all")
+
+        response = await authenticated_ac.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="/tasks/all",status="200"}'
+            in response.text
+        )
+        assert 'http_requests_in_progress{method="GET"} 1' in response.text
+        assert (
+            'db_query_duration_seconds_count{database="primary",operation="SELECT"}'
+            in (response.text)
+        )
+
+    async def test_get_replicas(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        monitoring_headers: dict,
+    ):
+        response = await authenticated_ac.get(
+            "/monitoring/replicas", headers=monitoring_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["replicas"] == []
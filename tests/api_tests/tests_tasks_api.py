@@ -1,9 +1,23 @@
+# STDLIB
+import asyncio
+import csv
+import io
+import json
+
 # THIRDPARTY
 from httpx import AsyncClient
 import pytest
+from sqlalchemy import Engine, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # FIRSTPARTY
+from app.config import settings
+from app.database import SessionLocal
+from app.monitoring.metrics import query_duration
+from app.tasks.cache import tasks_response_cache
+from app.tasks.dao import TasksDAO
 from app.tasks.models import Tasks
+from app.users.cache import get_cached_user
 from app.users.models import Users
 
 
@@ -30,6 +44,26 @@ class TestTasksAPI:
 
         assert response.status_code == status_code
 
+    @pytest.mark.parametrize(
+        "tasks_count, status_code", [(1, 200), (100, 200), (0, 422), (1001, 422)]
+    )
+    async def test_create_tasks(
+        self,
+        create_user: Users,
+        tasks_count: int,
+        status_code: int,
+        authenticated_ac: AsyncClient,
+    ):
+        new_tasks = [{"name": f"Задача {i}"} for i in range(tasks_count)]
+
+        response = await authenticated_ac.post("/tasks/bulk", json=new_tasks)
+
+        assert response.status_code == status_code
+        if status_code == 200:
+            assert [task["name"] for task in response.json()] == [
+                task["name"] for task in new_tasks
+            ]
+
     async def test_get_all_tasks(
         self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
     ):
@@ -38,6 +72,276 @@ class TestTasksAPI:
         assert response.status_code == 200
         assert response.json() is not None
 
+    @pytest.mark.parametrize("params", [{}, {"cursor": ""}])
+    async def test_get_all_tasks_cached(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        params: dict,
+        authenticated_ac: AsyncClient,
+    ):
+        statements = []
+
+        def capture_statement(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        first_response = await authenticated_ac.get("/tasks/all", params=params)
+        stats = tasks_response_cache.stats()
+        event.listen(Engine, "before_cursor_execute", capture_statement)
+        try:
+            second_response = await authenticated_ac.get("/tasks/all", params=params)
+        finally:
+            event.remove(Engine, "before_cursor_execute", capture_statement)
+
+        assert tasks_response_cache.stats()["hits"] == stats["hits"] + 1
+        assert tasks_response_cache.stats()["misses"] == stats["misses"]
+        assert not [statement for statement in statements if "tasks" in statement]
+        assert second_response.content == first_response.content
+        assert second_response.headers["ETag"] == first_response.headers["ETag"]
+
+        await authenticated_ac.patch(
+            "/tasks/update",
+            params={"task_id": str(create_task.uuid), "status": "WORKING"},
+        )
+        misses = tasks_response_cache.stats()["misses"]
+        response = await authenticated_ac.get("/tasks/all", params=params)
+        tasks = response.json() if not params else response.json()["items"]
+
+        assert tasks_response_cache.stats()["misses"] == misses + 1
+
+        assert [task["status"] for task in tasks] == ["WORKING"]
+
+    async def test_get_all_tasks_by_cursor(
+        self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
+    ):
+        for name in ("Вторая задача", "Третья задача"):
+            await authenticated_ac.post("/tasks/create", params={"name": name})
+
+        task_ids = []
+        cursor = ""
+        while cursor is not None:
+            response = await authenticated_ac.get(
+                "/tasks/all", params={"cursor": cursor, "limit": 2}
+            )
+
+            assert response.status_code == 200
+            task_ids += [task["uuid"] for task in response.json()["items"]]
+            cursor = response.json()["next_cursor"]
+
+        assert len(task_ids) == 3
+        assert task_ids == sorted(task_ids)
+
+    async def test_fast_json_responses(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        authenticated_ac: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        requests = [
+            ("/tasks/all", {}),
+            ("/tasks/all", {"cursor": ""}),
+            (f"/tasks/{create_task.uuid}", {}),
+        ]
+        responses = [
+            (await authenticated_ac.get(path, params=params)).json()
+            for path, params in requests
+        ]
+
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+        fast_responses = [
+            (await authenticated_ac.get(path, params=params)).json()
+            for path, params in requests
+        ]
+
+        assert fast_responses == responses
+
+    @pytest.mark.parametrize(
+        "statuses, tasks_count",
+        [(["CREATED"], 1), (["WORKING", "COMPLETED"], 0), (["WRONG_STATUS"], None)],
+    )
+    async def test_get_all_tasks_by_status(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        statuses: list[str],
+        tasks_count: int | None,
+        authenticated_ac: AsyncClient,
+    ):
+        response = await authenticated_ac.get(
+            "/tasks/all", params={"status": statuses, "cursor": ""}
+        )
+
+        if tasks_count is None:
+            assert response.status_code == 422
+        else:
+            assert response.status_code == 200
+            assert len(response.json()["items"]) == tasks_count
+
+    @pytest.mark.parametrize("cursor, status_code", [("wrong", 400), ("WyJ4Il0", 400)])
+    async def test_get_all_tasks_by_wrong_cursor(
+        self,
+        create_user: Users,
+        cursor: str,
+        status_code: int,
+        authenticated_ac: AsyncClient,
+    ):
+        response = await authenticated_ac.get("/tasks/all", params={"cursor": cursor})
+
+        assert response.status_code == status_code
+
+    async def test_export_tasks_ndjson(
+        self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
+    ):
+        response = await authenticated_ac.get(
+            "/tasks/export", params={"format": "ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        tasks = [json.loads(line) for line in response.text.splitlines()]
+        assert [task["uuid"] for task in tasks] == [str(create_task.uuid)]
+
+    async def test_export_tasks_csv(
+        self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
+    ):
+        response = await authenticated_ac.get("/tasks/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        tasks = list(csv.DictReader(io.StringIO(response.text)))
+        assert [task["uuid"] for task in tasks] == [str(create_task.uuid)]
+        assert tasks[0]["status"] == "CREATED"
+
+    async def test_import_tasks_ndjson(
+        self, create_user: Users, authenticated_ac: AsyncClient
+    ):
+        content = "\n".join(
+            [
+                json.dumps({"name": "Первая задача", "description": "Описание"}),
+                json.dumps({"name": ""}),
+                "not json",
+                "",
+                json.dumps({"name": "Вторая задача"}),
+            ]
+        )
+
+        copy_count = sum(query_duration._counts.get(("primary", "COPY"), []))
+
+        response = await authenticated_ac.post(
+            "/tasks/import", params={"format": "ndjson"}, content=content.encode()
+        )
+
+        assert response.status_code == 200
+        assert sum(query_duration._counts[("primary", "COPY")]) == copy_count + 1
+        assert response.json()["imported"] == 2
+        assert response.json()["failed"] == 2
+        assert [error["line"] for error in response.json()["errors"]] == [2, 3]
+
+        response = await authenticated_ac.get("/tasks/all", params={"cursor": ""})
+
+        assert sorted(task["name"] for task in response.json()["items"]) == [
+            "Вторая задача",
+            "Первая задача",
+        ]
+
+    async def test_import_tasks_csv(
+        self, create_user: Users, authenticated_ac: AsyncClient
+    ):
+        async def content():
+            yield 'name,description\nПервая задача,"Много\n'.encode()
+            yield 'строк"\nВторая зад'.encode()
+            yield "ача,\n,Без названия\n".encode()
+
+        response = await authenticated_ac.post(
+            "/tasks/import", params={"format": "csv"}, content=content()
+        )
+
+        assert response.status_code == 200
+        assert response.json()["imported"] == 2
+        assert response.json()["failed"] == 1
+        assert response.json()["errors"][0]["line"] == 5
+
+        response = await authenticated_ac.get("/tasks/export", params={"format": "csv"})
+        tasks = {
+            task["name"]: task for task in csv.DictReader(io.StringIO(response.text))
+        }
+
+        assert tasks["Первая задача"]["description"] == "Много\nстрок"
+
+    async def test_import_tasks_rollback(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        get_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        # Пользователь берётся из кеша, поэтому до COPY сессия не выполняет запросов.
+        await authenticated_ac.get("/auth/me")
+        assert get_cached_user(str(create_user.uuid))
+
+        def fail_after_import(*args, **kwargs):
+            raise RuntimeError("Request failed after import")
+
+        monkeypatch.setattr(TasksDAO, "publish_changes", fail_after_import)
+
+        with pytest.raises(RuntimeError):
+            await authenticated_ac.post(
+                "/tasks/import",
+                params={"format": "ndjson"},
+                content=json.dumps({"name": "Задача"}).encode(),
+            )
+
+        tasks = await get_session.scalars(
+            select(Tasks).where(Tasks.user_id == create_user.uuid)
+        )
+        assert tasks.all() == []
+
+    async def test_import_tasks_timeout(
+        self,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        get_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(settings, "TASKS_IMPORT_BATCH_SIZE", 1)
+        monkeypatch.setattr(settings, "TASKS_IMPORT_TIMEOUT", 0.5)
+        user_id = create_user.uuid
+        first_batch_copied = asyncio.Event()
+
+        async def slow_content():
+            yield (json.dumps({"name": "Импорт"}) + "\n").encode()
+            yield (json.dumps({"name": "Импорт"}) + "\n").encode()
+            first_batch_copied.set()
+            await asyncio.sleep(10)
+            yield b""
+
+        async def write_same_user():
+            await first_batch_copied.wait()
+            async with SessionLocal() as session:
+                await TasksDAO.add(
+                    session=session, user_id=user_id, name="Запись", status="CREATED"
+                )
+                await session.commit()
+
+        # Запись того же пользователя ждёт блокировку строки счётчиков, пока загрузка
+        # не будет прервана по TASKS_IMPORT_TIMEOUT.
+        response, _ = await asyncio.wait_for(
+            asyncio.gather(
+                authenticated_ac.post(
+                    "/tasks/import", params={"format": "ndjson"}, content=slow_content()
+                ),
+                write_same_user(),
+            ),
+            timeout=5,
+        )
+
+        assert response.status_code == 408
+        tasks = await get_session.scalars(
+            select(Tasks.name).where(Tasks.user_id == user_id)
+        )
+        assert tasks.all() == ["Запись"]
+
     @pytest.mark.parametrize(
         "task_id, status_code",
         [
@@ -64,6 +368,58 @@ class TestTasksAPI:
 
         assert response.status_code == 200
 
+    @pytest.mark.parametrize("fast_json", [False, True])
+    async def test_get_task_not_modified(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        fast_json: bool,
+        authenticated_ac: AsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast_json)
+        url = f"/tasks/{create_task.uuid}"
+
+        etag = (await authenticated_ac.get(url)).headers["ETag"]
+        response = await authenticated_ac.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+        await authenticated_ac.patch(
+            "/tasks/update",
+            params={"task_id": str(create_task.uuid), "status": "WORKING"},
+        )
+        response = await authenticated_ac.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()["status"] == "WORKING"
+
+    @pytest.mark.parametrize("params", [{}, {"cursor": ""}])
+    async def test_get_all_tasks_not_modified(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        params: dict,
+        authenticated_ac: AsyncClient,
+    ):
+        etag = (await authenticated_ac.get("/tasks/all", params=params)).headers["ETag"]
+        response = await authenticated_ac.get(
+            "/tasks/all", params=params, headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+        await authenticated_ac.post("/tasks/create", params={"name": "Новая задача"})
+        response = await authenticated_ac.get(
+            "/tasks/all", params=params, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     @pytest.mark.parametrize(
         "status, status_code",
         [("WORKING", 200), ("COMPLETED", 200), ("WRONG_STATUS", 422)],
@@ -103,6 +459,155 @@ class TestTasksAPI:
 
         assert response_409_status_code.status_code == status_code
 
+    @pytest.mark.parametrize(
+        "first_status, second_status, status_code",
+        [("WORKING", "WORKING", 409), ("COMPLETED", "WORKING", 409)],
+    )
+    async def test_update_task_status_forbidden(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        first_status: str,
+        second_status: str,
+        status_code: int,
+        authenticated_ac: AsyncClient,
+    ):
+        await authenticated_ac.patch(
+            "/tasks/update",
+            params={"task_id": str(create_task.uuid), "status": first_status},
+        )
+
+        response = await authenticated_ac.patch(
+            "/tasks/update",
+            params={"task_id": str(create_task.uuid), "status": second_status},
+        )
+
+        assert response.status_code == status_code
+        assert response.json()["detail"] == "You can not update task"
+
+    async def test_update_tasks_status(
+        self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
+    ):
+        task_ids = [str(create_task.uuid), "dcf11111-1111-1111-b1b1-c111c1fbe111"]
+
+        response = await authenticated_ac.patch(
+            "/tasks/bulk", json={"task_ids": task_ids, "status": "WORKING"}
+        )
+
+        assert response.status_code == 200
+        assert [task["result"] for task in response.json()] == ["updated", "not_found"]
+
+        response = await authenticated_ac.patch(
+            "/tasks/bulk", json={"task_ids": task_ids, "status": "WORKING"}
+        )
+
+        assert response.status_code == 200
+        assert [task["result"] for task in response.json()] == [
+            "forbidden",
+            "not_found",
+        ]
+
+    @pytest.mark.parametrize(
+        "task_ids, status, status_code",
+        [([], "WORKING", 422), (["wrong_id"], "WORKING", 422), (None, "CREATED", 422)],
+    )
+    async def test_update_tasks_status_422_status_code(
+        self,
+        create_user: Users,
+        create_task: Tasks,
+        task_ids: list[str] | None,
+        status: str,
+        status_code: int,
+        authenticated_ac: AsyncClient,
+    ):
+        if task_ids is None:
+            task_ids = [str(create_task.uuid)]
+
+        response = await authenticated_ac.patch(
+            "/tasks/bulk", json={"task_ids": task_ids, "status": status}
+        )
+
+        assert response.status_code == status_code
+
+    async def test_search_tasks(
+        self, create_user: Users, authenticated_ac: AsyncClient
+    ):
+        await authenticated_ac.post(
+            "/tasks/bulk",
+            json=[
+                {"name": "Купить молоко", "description": "В магазине у дома"},
+                {"name": "Позвонить маме", "description": "Спросить, купить ли молоко"},
+                {"name": "Починить кран"},
+            ],
+        )
+
+        response = await authenticated_ac.get(
+            "/tasks/search", params={"q": "молоко", "limit": 1}
+        )
+
+        assert response.status_code == 200
+        assert [task["name"] for task in response.json()["items"]] == ["Купить молоко"]
+
+        response = await authenticated_ac.get(
+            "/tasks/search",
+            params={
+                "q": "молоко",
+                "limit": 1,
+                "cursor": response.json()["next_cursor"],
+            },
+        )
+
+        assert [task["name"] for task in response.json()["items"]] == ["Позвонить маме"]
+        assert response.json()["next_cursor"] is None
+
+    @pytest.mark.parametrize(
+        "params, status_code",
+        [({"q": ""}, 422), ({"q": "молоко", "cursor": "wrong_cursor"}, 400)],
+    )
+    async def test_search_tasks_fail(
+        self,
+        create_user: Users,
+        params: dict,
+        status_code: int,
+        authenticated_ac: AsyncClient,
+    ):
+        response = await authenticated_ac.get("/tasks/search", params=params)
+
+        assert response.status_code == status_code
+
+    async def test_get_tasks_stats(
+        self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
+    ):
+        response = await authenticated_ac.post(
+            "/tasks/bulk", json=[{"name": "Вторая задача"}, {"name": "Третья задача"}]
+        )
+        second_task_id, third_task_id = [task["uuid"] for task in response.json()]
+        await authenticated_ac.post(
+            "/tasks/import",
+            params={"format": "ndjson"},
+            content=json.dumps({"name": "Четвёртая задача"}).encode(),
+        )
+        await authenticated_ac.patch(
+            "/tasks/update",
+            params={"task_id": str(create_task.uuid), "status": "WORKING"},
+        )
+        await authenticated_ac.patch(
+            "/tasks/bulk", json={"task_ids": [second_task_id], "status": "COMPLETED"}
+        )
+        await authenticated_ac.delete(
+            "/tasks/delete", params={"task_id": third_task_id}
+        )
+
+        response = await authenticated_ac.get("/tasks/stats")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "CREATED": 1,
+            "WORKING": 1,
+            "COMPLETED": 1,
+            "total": 3,
+        }
+
     async def test_delete_task(
         self, create_user: Users, create_task: Tasks, authenticated_ac: AsyncClient
     ):
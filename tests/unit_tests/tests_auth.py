@@ -0,0 +1,69 @@
+# STDLIB
+from datetime import UTC, datetime, timedelta
+
+# THIRDPARTY
+import jwt
+import pytest
+
+# FIRSTPARTY
+from app.config import settings
+from app.exceptions import (
+    IncorrectTokenFormatException,
+    PasswordHashingOverloadedException,
+    TokenExpiredException,
+)
+from app.users.auth import create_access_token, decode_access_token
+from app.users.cache import token_cache
+from app.users.hashing import (
+    PasswordHashExecutor,
+    get_password_hash,
+    verify_password,
+)
+
+
+class TestAuth:
+    async def test_decode_access_token(self):
+        token = create_access_token({"sub": "dcf11111-1111-1111-b1b1-c111c1fbe111"})
+        hits = token_cache.hits
+
+        payload = decode_access_token(token)
+        cached_payload = decode_access_token(token)
+
+        assert payload["sub"] == "dcf11111-1111-1111-b1b1-c111c1fbe111"
+        assert cached_payload == payload
+        assert token_cache.hits == hits + 1
+
+    async def test_decode_expired_access_token(self):
+        token = jwt.encode(
+            {"sub": "user", "exp": datetime.now(UTC) - timedelta(minutes=1)},
+            settings.SECRET_KEY,
+            settings.ALGORITHM,
+        )
+
+        with pytest.raises(TokenExpiredException):
+            decode_access_token(token)
+
+    @pytest.mark.parametrize("token", ["not.a.token", "token"])
+    async def test_decode_incorrect_access_token(self, token: str):
+        with pytest.raises(IncorrectTokenFormatException):
+            decode_access_token(token)
+
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    async def test_password_hash_executor(self, kind: str):
+        executor = PasswordHashExecutor(kind=kind, max_workers=1, max_pending=1)
+        try:
+            hashed_password = await executor.run(get_password_hash, "kolobok")
+
+            assert await executor.run(verify_password, "kolobok", hashed_password)
+            assert not await executor.run(verify_password, "ffffff", hashed_password)
+            assert executor.stats()["completed"] == 3
+        finally:
+            executor.shutdown()
+
+    async def test_password_hash_executor_overloaded(self):
+        executor = PasswordHashExecutor(kind="thread", max_workers=1, max_pending=0)
+
+        with pytest.raises(PasswordHashingOverloadedException):
+            await executor.run(get_password_hash, "kolobok")
+
+        assert executor.stats()["rejected"] == 1
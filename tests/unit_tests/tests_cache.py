@@ -0,0 +1,45 @@
+# STDLIB
+import time
+
+# THIRDPARTY
+import pytest
+
+# FIRSTPARTY
+from app.cache import TTLCache
+
+
+class TestTTLCache:
+    async def test_get_set(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("absent") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.get("first")
+        cache.set("third", 3)
+
+        assert cache.get("first") == 1
+        assert cache.get("second") is None
+        assert cache.get("third") == 3
+
+    @pytest.mark.parametrize("ttl", [0.01])
+    async def test_expiration(self, ttl: float):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value", ttl=ttl)
+        time.sleep(ttl * 2)
+
+        assert cache.get("key") is None
+
+    async def test_delete(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value")
+        cache.delete("key")
+
+        assert cache.get("key") is None
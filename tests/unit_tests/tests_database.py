@@ -0,0 +1,94 @@
+# STDLIB
+from typing import AsyncGenerator
+
+# THIRDPARTY
+from httpx import AsyncClient
+import pytest
+from sqlalchemy import Engine, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# FIRSTPARTY
+from app.tasks.dao import TasksDAO
+from app.tasks.models import Tasks
+from app.users.models import Users
+
+
+@pytest.fixture
+async def transactions() -> AsyncGenerator[list, None]:
+    """
+    Записывает события транзакций всех движков: выполненные запросы с признаком
+    открытой транзакции на стороне asyncpg, а также COMMIT и ROLLBACK.
+    """
+    events = []
+
+    def after_execute(conn, _cursor, statement, *_):
+        in_transaction = conn.connection.driver_connection.is_in_transaction()
+        events.append(("execute", statement, in_transaction))
+
+    def commit(_conn):
+        events.append(("commit",))
+
+    def rollback(_conn):
+        events.append(("rollback",))
+
+    listeners = [
+        ("after_cursor_execute", after_execute),
+        ("commit", commit),
+        ("rollback", rollback),
+    ]
+    for name, listener in listeners:
+        event.listen(Engine, name, listener)
+    try:
+        yield events
+    finally:
+        for name, listener in listeners:
+            event.remove(Engine, name, listener)
+
+
+class TestGetSession:
+    async def test_read_only_without_transaction(
+        self, create_user: Users, authenticated_ac: AsyncClient, transactions: list
+    ):
+        response = await authenticated_ac.get("/tasks/all", params={"cursor": ""})
+
+        assert response.status_code == 200
+        executed = [event for event in transactions if event[0] == "execute"]
+        assert any("FROM tasks" in statement for _, statement, _ in executed)
+        assert not any(in_transaction for _, _, in_transaction in executed)
+        assert ("commit",) not in transactions
+
+    async def test_write_commits(
+        self, create_user: Users, authenticated_ac: AsyncClient, transactions: list
+    ):
+        response = await authenticated_ac.post(
+            "/tasks/create", params={"name": "Задача"}
+        )
+
+        assert response.status_code == 200
+        executed = [event for event in transactions if event[0] == "execute"]
+        assert any("INSERT INTO tasks" in statement for _, statement, _ in executed)
+        assert all(in_transaction for _, _, in_transaction in executed)
+        assert ("commit",) in transactions
+
+    async def test_write_rolls_back_on_error(
+        self,
+        get_session: AsyncSession,
+        create_user: Users,
+        authenticated_ac: AsyncClient,
+        transactions: list,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        def fail_after_insert(*args, **kwargs):
+            raise RuntimeError("Request failed after insert")
+
+        monkeypatch.setattr(TasksDAO, "publish_changes", fail_after_insert)
+
+        with pytest.raises(RuntimeError):
+            await authenticated_ac.post("/tasks/create", params={"name": "Задача"})
+
+        assert ("rollback",) in transactions
+        assert ("commit",) not in transactions
+        tasks = await get_session.scalars(
+            select(Tasks).where(Tasks.user_id == create_user.uuid)
+        )
+        assert tasks.all() == []
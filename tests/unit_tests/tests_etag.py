@@ -0,0 +1,29 @@
+# THIRDPARTY
+import pytest
+
+# FIRSTPARTY
+from app.etag import etag_matches, make_etag
+
+
+class TestETag:
+    async def test_make_etag(self):
+        etag = make_etag([("first", 1), ("second", 1)])
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag([("first", 1), ("second", 1)])
+        assert etag != make_etag([("first", 1), ("second", 2)])
+        assert etag != make_etag([("second", 1), ("first", 1)])
+
+    @pytest.mark.parametrize(
+        "if_none_match, matches",
+        [
+            (None, False),
+            ('"other"', False),
+            ('"etag"', True),
+            ('W/"etag"', True),
+            ('"other", "etag"', True),
+            ("*", True),
+        ],
+    )
+    async def test_etag_matches(self, if_none_match: str | None, matches: bool):
+        assert etag_matches(if_none_match, '"etag"') == matches
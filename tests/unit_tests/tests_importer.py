@@ -0,0 +1,56 @@
+# STDLIB
+from typing import AsyncIterator
+
+# FIRSTPARTY
+from app.tasks.importer import (
+    LINE_TOO_LONG_ERROR,
+    MAX_CSV_RECORD_LENGTH,
+    MAX_LINE_LENGTH,
+    iter_csv_records,
+    iter_lines,
+    iter_ndjson_records,
+)
+
+
+async def chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    """Отдаёт тело запроса частями."""
+    for part in parts:
+        yield part
+
+
+async def collect(iterator: AsyncIterator) -> list:
+    """Собирает элементы асинхронного итератора в список."""
+    return [item async for item in iterator]
+
+
+class TestImporter:
+    async def test_iter_lines_too_long(self):
+        long_part = b"x" * (MAX_LINE_LENGTH // 2 + 1)
+
+        lines = await collect(
+            iter_lines(chunks(b"first\n", long_part, long_part, long_part, b"x\nlast"))
+        )
+
+        assert lines == [(1, "first"), (2, None), (3, "last")]
+
+    async def test_iter_lines_too_long_without_newline(self):
+        lines = await collect(iter_lines(chunks(b"x" * (MAX_LINE_LENGTH + 1))))
+
+        assert lines == [(1, None)]
+
+    async def test_ndjson_line_too_long(self):
+        body = b'{"name": "' + b"x" * MAX_LINE_LENGTH + b'"}\n{"name": "Task"}'
+
+        records = await collect(iter_ndjson_records(iter_lines(chunks(body))))
+
+        assert records == [(1, LINE_TOO_LONG_ERROR), (2, {"name": "Task"})]
+
+    async def test_csv_record_too_long(self):
+        line = "x" * 1000 + "\n"
+        body = 'name,description\nTask,"unbalanced\n' + line * (
+            MAX_CSV_RECORD_LENGTH // len(line) + 1
+        )
+
+        records = await collect(iter_csv_records(iter_lines(chunks(body.encode()))))
+
+        assert records[0] == (2, "Invalid CSV: record too long")
@@ -0,0 +1,94 @@
+# STDLIB
+import asyncio
+import json
+import uuid
+
+# THIRDPARTY
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# FIRSTPARTY
+from app.config import settings
+from app.invalidation import (
+    InvalidationBus,
+    invalidation_bus,
+    publish_invalidation,
+)
+
+
+async def wait_for(condition, timeout: float = 5) -> bool:
+    """Ждёт выполнения условия не дольше timeout секунд."""
+    for _ in range(int(timeout / 0.05)):
+        if condition():
+            return True
+        await asyncio.sleep(0.05)
+    return condition()
+
+
+class TestInvalidationBus:
+    async def test_invalidate_after_commit(
+        self, get_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(invalidation_bus, "_handlers", {})
+        invalidated = []
+        invalidation_bus.register("tests", invalidated.append, invalidated.clear)
+        owner_id = str(uuid.uuid4())
+
+        await get_session.execute(select(1))
+        publish_invalidation(get_session, "tests", owner_id)
+        await get_session.rollback()
+
+        assert invalidated == []
+
+        await get_session.execute(select(1))
+        publish_invalidation(get_session, "tests", owner_id)
+        await get_session.commit()
+
+        assert invalidated == [owner_id]
+
+    async def test_listen(
+        self, get_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "CACHE_INVALIDATION_BUS", True)
+        bus = InvalidationBus(
+            dsn=invalidation_bus.dsn, channel=invalidation_bus.channel
+        )
+        invalidated = []
+        bus.register("tests", invalidated.append, lambda: None)
+        owner_id = str(uuid.uuid4())
+
+        assert bus.cache_ttl() == settings.CACHE_INVALIDATION_FALLBACK_TTL
+
+        bus.start()
+        try:
+            assert await wait_for(lambda: bus.connected)
+            assert bus.cache_ttl() is None
+
+            await get_session.execute(select(1))
+            publish_invalidation(get_session, "tests", owner_id)
+            await get_session.commit()
+
+            assert await wait_for(lambda: owner_id in invalidated)
+        finally:
+            await bus.stop()
+
+        assert not bus.connected
+
+    @pytest.mark.parametrize(
+        "payload, invalidated",
+        [
+            (json.dumps({"origin": "other", "entity": "tests", "owner": "1"}), ["1"]),
+            (json.dumps({"origin": "own", "entity": "tests", "owner": "1"}), []),
+            ("not json", []),
+        ],
+    )
+    async def test_handle_notification(self, payload: str, invalidated: list):
+        bus = InvalidationBus(dsn="", channel="tests")
+        bus.origin = "own"
+        received = []
+        bus.register("tests", received.append, received.clear)
+
+        bus.handle_notification(payload)
+
+        assert received == invalidated
@@ -0,0 +1,77 @@
+# STDLIB
+import json
+import logging
+import queue
+import sys
+
+# THIRDPARTY
+import pytest
+
+# FIRSTPARTY
+from app.logger import BoundedQueueHandler, JsonFormatter, SamplingFilter
+from app.monitoring.metrics import log_records_dropped
+
+
+def make_record(message: str, *args) -> logging.LogRecord:
+    """Создаёт запись лога уровня INFO."""
+    return logging.LogRecord("tests", logging.INFO, __file__, 1, message, args, None)
+
+
+class TestLogger:
+    async def test_queue_handler_drop(self):
+        log_queue = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(log_queue, policy="drop")
+        dropped = log_records_dropped._values[()]
+
+        for _ in range(3):
+            handler.handle(make_record("Request handling time: %s", 0.1))
+
+        assert log_queue.qsize() == 1
+        assert log_records_dropped._values[()] == dropped + 2
+
+    async def test_queue_handler_renders_message(self):
+        log_queue = queue.Queue()
+        handler = BoundedQueueHandler(log_queue, policy="block")
+        task_ids = ["first"]
+
+        handler.handle(make_record("Tasks: %s", task_ids))
+        task_ids.append("second")
+
+        queued = log_queue.get_nowait()
+        assert queued.getMessage() == "Tasks: ['first']"
+        assert queued.args is None
+
+    async def test_queue_handler_formats_exception(self):
+        log_queue = queue.Queue()
+        handler = BoundedQueueHandler(log_queue, policy="block")
+        try:
+            raise ValueError("Ошибка")
+        except ValueError:
+            record = make_record("Request failed")
+            record.exc_info = sys.exc_info()
+
+        handler.handle(record)
+
+        queued = log_queue.get_nowait()
+        assert queued.exc_info is None
+        assert "ValueError: Ошибка" in queued.exc_text
+        assert (
+            "ValueError: Ошибка"
+            in json.loads(JsonFormatter().format(queued))["exception"]
+        )
+        assert "ValueError: Ошибка" in logging.Formatter().format(queued)
+
+    @pytest.mark.parametrize("rate, passed", [(0, 0), (1, 10)])
+    async def test_sampling_filter(self, rate: float, passed: int):
+        sampling_filter = SamplingFilter(["Request handling time"], rate=rate)
+
+        records = [make_record(f"Request handling time: {i}") for i in range(10)]
+
+        assert sum(sampling_filter.filter(record) for record in records) == passed
+        assert sampling_filter.filter(make_record("User registered"))
+
+    async def test_json_formatter(self):
+        line = JsonFormatter().format(make_record("Задача %s", "создана"))
+
+        assert json.loads(line)["message"] == "Задача создана"
+        assert json.loads(line)["level"] == "INFO"
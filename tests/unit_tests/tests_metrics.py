@@ -0,0 +1,54 @@
+# THIRDPARTY
+import pytest
+
+# FIRSTPARTY
+from app.monitoring.metrics import (
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    sql_operation,
+)
+
+
+class TestMetrics:
+    async def test_histogram(self):
+        histogram = Histogram(
+            "test_seconds", "Test histogram.", labelnames=("route",), buckets=(0.1, 1)
+        )
+
+        for value in (0.05, 0.1, 0.5, 5):
+            histogram.observe(value, route="/tasks/{task_id}")
+
+        assert histogram.render().splitlines() == [
+            "# HELP test_seconds Test histogram.",
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{route="/tasks/{task_id}",le="0.1"} 2',
+            'test_seconds_bucket{route="/tasks/{task_id}",le="1"} 3',
+            'test_seconds_bucket{route="/tasks/{task_id}",le="+Inf"} 4',
+            'test_seconds_sum{route="/tasks/{task_id}"} 5.65',
+            'test_seconds_count{route="/tasks/{task_id}"} 4',
+        ]
+
+    async def test_gauge(self):
+        gauge = Gauge("test_in_progress", "Test gauge.", labelnames=("method",))
+
+        gauge.inc(method="GET")
+        gauge.inc(method="GET")
+        gauge.dec(method="GET")
+
+        registry = MetricsRegistry([gauge])
+        assert 'test_in_progress{method="GET"} 1' in registry.render().splitlines()
+        assert registry.render().endswith("\n")
+
+    @pytest.mark.parametrize(
+        "statement, operation",
+        [
+            ("SELECT 1", "SELECT"),
+            ("\n  insert INTO tasks VALUES (1)", "INSERT"),
+            ("WITH rows AS (SELECT 1) SELECT * FROM rows", "WITH"),
+            ("BEGIN", "OTHER"),
+            ("", "OTHER"),
+        ],
+    )
+    async def test_sql_operation(self, statement: str, operation: str):
+        assert sql_operation(statement) == operation
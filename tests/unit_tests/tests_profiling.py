@@ -0,0 +1,90 @@
+# STDLIB
+import asyncio
+from collections import Counter
+import os
+from pathlib import Path
+import time
+
+# THIRDPARTY
+import httpx
+from httpx import AsyncClient
+import pytest
+
+# FIRSTPARTY
+from app.config import settings
+from app.main import app as fastapi_app
+from app.monitoring.profiling import (
+    ProfilingMiddleware,
+    TaskSampler,
+    store_profile,
+)
+
+
+def busy(seconds: float) -> None:
+    """Занимает поток на seconds секунд."""
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < seconds:
+        pass
+
+
+async def handle_request() -> None:
+    """Имитирует обработку запроса: ожидание и вычисления."""
+    await asyncio.sleep(0.05)
+    busy(0.05)
+
+
+class TestProfiling:
+    async def test_task_sampler(self):
+        task = asyncio.create_task(handle_request())
+        sampler = TaskSampler(task, interval=0.001)
+
+        sampler.start()
+        await task
+        samples = sampler.stop()
+
+        stacks = "\n".join(samples)
+        assert "handle_request" in stacks
+        assert "await Future" in stacks
+        assert any(stack.split(";")[-1].startswith("busy ") for stack in samples)
+
+    async def test_store_profile(self, tmp_path: Path):
+        for number in range(3):
+            store_profile(
+                str(tmp_path), f"{number}.folded", Counter({"a;b": 1}), max_bytes=12
+            )
+            os.utime(tmp_path / f"{number}.folded", (number, number))
+
+        assert sorted(os.listdir(tmp_path)) == ["1.folded", "2.folded"]
+        assert (tmp_path / "2.folded").read_text() == "a;b 1\n"
+
+    @pytest.mark.parametrize(
+        "token, headers, profiled",
+        [
+            ("secret", {"X-Profile": "secret"}, True),
+            ("secret", {"X-Profile": "wrong"}, False),
+            ("secret", {}, False),
+            ("", {"X-Profile": ""}, False),
+            ("", {"X-Profile": "anything"}, False),
+        ],
+    )
+    async def test_profiling_middleware(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        token: str,
+        headers: dict,
+        profiled: bool,
+    ):
+        monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+        monkeypatch.setattr(settings, "PROFILING_TOKEN", token)
+        async with AsyncClient(
+            base_url="http://test",
+            transport=httpx.ASGITransport(app=ProfilingMiddleware(fastapi_app)),
+        ) as ac:
+            response = await ac.get("/tasks/all", headers=headers)
+
+        assert response.status_code == 401
+        assert ("x-profile-id" in response.headers) == profiled
+        assert os.listdir(tmp_path) == (
+            [response.headers["x-profile-id"]] if profiled else []
+        )
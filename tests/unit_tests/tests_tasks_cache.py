@@ -0,0 +1,39 @@
+# STDLIB
+import uuid
+
+# FIRSTPARTY
+from app.cache import TTLCache
+from app.tasks.cache import TasksResponseCache
+
+
+class TestTasksResponseCache:
+    async def test_get_set(self):
+        cache = TasksResponseCache(TTLCache(maxsize=10, ttl=60))
+        user_id = uuid.uuid4()
+
+        cache.set(cache.key(user_id, ("page", 1)), b"[]")
+
+        assert cache.get(cache.key(user_id, ("page", 1))) == b"[]"
+        assert cache.get(cache.key(user_id, ("page", 2))) is None
+        assert cache.get(cache.key(uuid.uuid4(), ("page", 1))) is None
+
+    async def test_invalidate(self):
+        cache = TasksResponseCache(TTLCache(maxsize=10, ttl=60))
+        user_id = uuid.uuid4()
+        key = cache.key(user_id, ("page", 1))
+
+        cache.invalidate(user_id)
+        cache.set(key, b"[]")
+
+        assert cache.get(cache.key(user_id, ("page", 1))) is None
+
+    async def test_stats(self):
+        cache = TasksResponseCache(TTLCache(maxsize=10, ttl=60))
+        user_id = uuid.uuid4()
+
+        cache.get(cache.key(user_id, ("page", 1)))
+        cache.set(cache.key(user_id, ("page", 1)), b"[]")
+        cache.get(cache.key(user_id, ("page", 1)))
+        cache.get(cache.key(user_id, ("page", 2)))
+
+        assert cache.stats() == {"hits": 1, "misses": 2, "size": 1, "maxsize": 10}
@@ -1,10 +1,14 @@
+# STDLIB
+import uuid
+
 # THIRDPARTY
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # FIRSTPARTY
-from app.tasks.dao import TasksDAO
-from app.tasks.models import Tasks
+from app.dao.base import statement_cache
+from app.tasks.dao import TASK_ROW_COLUMNS, TasksDAO
+from app.tasks.models import StatusEnum, Tasks
 from app.users.models import Users
 
 
@@ -29,6 +33,23 @@ class TestTasksDAO:
         assert task.name == name
         assert task.description == description
 
+    async def test_add_many(self, get_session: AsyncSession, create_user: Users):
+        tasks = await TasksDAO.add_many(
+            session=get_session,
+            values=[
+                {
+                    "user_id": create_user.uuid,
+                    "name": f"Задача {i}",
+                    "description": None,
+                    "status": "CREATED",
+                }
+                for i in range(3)
+            ],
+        )
+
+        assert [task.name for task in tasks] == ["Задача 0", "Задача 1", "Задача 2"]
+        assert all(task.user_id == create_user.uuid for task in tasks)
+
     @pytest.mark.parametrize("page, page_size", [(1, 5)])
     async def test_find_all_users_tasks(
         self,
@@ -47,6 +68,47 @@ class TestTasksDAO:
 
         assert tasks is not None
 
+    async def test_find_users_tasks_after(
+        self, get_session: AsyncSession, create_user: Users, create_task: Tasks
+    ):
+        tasks = await TasksDAO.find_users_tasks_after(
+            session=get_session, user_id=str(create_user.uuid), after=None, limit=10
+        )
+
+        assert [task.uuid for task in tasks] == [create_task.uuid]
+
+        tasks = await TasksDAO.find_users_tasks_after(
+            session=get_session,
+            user_id=str(create_user.uuid),
+            after=str(create_task.uuid),
+            limit=10,
+        )
+
+        assert tasks == []
+
+    async def test_find_users_tasks_rows(
+        self, get_session: AsyncSession, create_user: Users, create_task: Tasks
+    ):
+        tasks = await TasksDAO.find_users_tasks_after(
+            session=get_session,
+            user_id=str(create_user.uuid),
+            after=None,
+            limit=10,
+            columns=TASK_ROW_COLUMNS,
+        )
+        task = await TasksDAO.find_users_task_row(
+            session=get_session,
+            task_id=str(create_task.uuid),
+            user_id=str(create_user.uuid),
+        )
+
+        assert not isinstance(tasks[0], Tasks)
+        assert tasks == [task]
+        assert task is not None
+        assert task.name == create_task.name
+        assert task.status == StatusEnum.CREATED
+        assert task.version == create_task.version
+
     async def test_find_one_or_none(
         self, get_session: AsyncSession, create_user: Users, create_task: Tasks
     ):
@@ -77,11 +139,163 @@ class TestTasksDAO:
         create_task: Tasks,
         status: str,
     ):
+        version = create_task.version
+
         updated_task = await TasksDAO.update(
             session=get_session, model_id=create_task.uuid, status=status
         )
 
         assert updated_task is not None
+        assert updated_task.version == version + 1
+
+    @pytest.mark.parametrize(
+        "status, updated", [("WORKING", True), ("COMPLETED", True)]
+    )
+    async def test_update_users_tasks_status(
+        self,
+        get_session: AsyncSession,
+        create_user: Users,
+        create_task: Tasks,
+        status: str,
+        updated: bool,
+    ):
+        found_tasks = await TasksDAO.update_users_tasks_status(
+            session=get_session,
+            user_id=str(create_user.uuid),
+            task_ids=[create_task.uuid],
+            status=status,
+        )
+
+        assert found_tasks == {create_task.uuid: updated}
+
+    @pytest.mark.parametrize(
+        "previous_statuses, updated", [(["CREATED"], True), (["WORKING"], False)]
+    )
+    async def test_conditional_update(
+        self,
+        get_session: AsyncSession,
+        create_user: Users,
+        create_task: Tasks,
+        previous_statuses: list[str],
+        updated: bool,
+    ):
+        updated_task, found = await TasksDAO.conditional_update(
+            session=get_session,
+            filters={"uuid": create_task.uuid, "user_id": create_user.uuid},
+            conditions=[Tasks.status.in_(previous_statuses)],
+            status="WORKING",
+        )
+
+        assert found
+        assert (updated_task is not None) == updated
+        if updated_task:
+            assert updated_task.status == StatusEnum.WORKING
+
+    async def test_conditional_delete(
+        self, get_session: AsyncSession, create_user: Users, create_task: Tasks
+    ):
+        deleted_task, found = await TasksDAO.conditional_delete(
+            session=get_session,
+            filters={"uuid": create_task.uuid, "user_id": create_user.uuid},
+        )
+
+        assert found
+        assert deleted_task is not None
+        assert deleted_task.uuid == create_task.uuid
+
+        deleted_task, found = await TasksDAO.conditional_delete(
+            session=get_session,
+            filters={"uuid": create_task.uuid, "user_id": create_user.uuid},
+        )
+
+        assert not found
+        assert deleted_task is None
+
+    async def test_search_users_tasks(
+        self, get_session: AsyncSession, create_user: Users, create_task: Tasks
+    ):
+        found_tasks = await TasksDAO.search_users_tasks(
+            session=get_session,
+            user_id=str(create_user.uuid),
+            query=create_task.name,
+            after=None,
+            limit=10,
+        )
+
+        assert [task.uuid for task, _ in found_tasks] == [create_task.uuid]
+
+        found_tasks = await TasksDAO.search_users_tasks(
+            session=get_session,
+            user_id=str(uuid.uuid4()),
+            query=create_task.name,
+            after=None,
+            limit=10,
+        )
+
+        assert found_tasks == []
+
+    async def test_count_users_tasks_by_status(
+        self, get_session: AsyncSession, create_user: Users, create_task: Tasks
+    ):
+        await TasksDAO.add_many(
+            session=get_session,
+            values=[
+                {"user_id": create_user.uuid, "name": "Задача", "status": "WORKING"}
+            ],
+        )
+
+        stats = await TasksDAO.count_users_tasks_by_status(
+            session=get_session, user_id=str(create_user.uuid)
+        )
+
+        assert stats == {"CREATED": 1, "WORKING": 1, "COMPLETED": 0}
+
+    async def test_statement_cache(
+        self, get_session: AsyncSession, create_user: Users, create_task: Tasks
+    ):
+        await TasksDAO.find_one_or_none(session=get_session, uuid=create_task.uuid)
+        hits = statement_cache.stats()["hits"]
+
+        task = await TasksDAO.find_one_or_none(
+            session=get_session, uuid=create_task.uuid
+        )
+        other_task = await TasksDAO.find_one_or_none(
+            session=get_session, uuid=uuid.uuid4()
+        )
+
+        assert task is not None and task.uuid == create_task.uuid
+        assert other_task is None
+        assert statement_cache.stats()["hits"] == hits + 2
+
+    async def test_find_all_none_filter(
+        self, get_session: AsyncSession, create_user: Users
+    ):
+        await TasksDAO.add_many(
+            session=get_session,
+            values=[
+                {
+                    "user_id": create_user.uuid,
+                    "name": "Без описания",
+                    "status": "CREATED",
+                },
+                {
+                    "user_id": create_user.uuid,
+                    "name": "С описанием",
+                    "description": "Описание",
+                    "status": "CREATED",
+                },
+            ],
+        )
+
+        without_description = await TasksDAO.find_all(
+            session=get_session, user_id=create_user.uuid, description=None
+        )
+        with_description = await TasksDAO.find_all(
+            session=get_session, user_id=create_user.uuid, description="Описание"
+        )
+
+        assert [task.name for task in without_description] == ["Без описания"]
+        assert [task.name for task in with_description] == ["С описанием"]
 
     async def test_delete(
         self, get_session: AsyncSession, create_user: Users, create_task: Tasks
@@ -3,6 +3,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # FIRSTPARTY
+from app.users.cache import cache_user, get_cached_user, invalidate_user
 from app.users.dao import UsersDAO
 from app.users.models import Users
 
@@ -58,3 +59,19 @@ class TestUsersDAO:
             assert user.email == email
         else:
             assert user is None
+
+    async def test_update_keeps_cache_on_rollback(
+        self, get_session: AsyncSession, create_user: Users
+    ):
+        user_id = create_user.uuid
+        cache_user(create_user)
+        try:
+            await UsersDAO.update(
+                session=get_session, model_id=user_id, email="new@test.com"
+            )
+            await get_session.rollback()
+
+            # Кеш сбрасывается шиной только после фиксации транзакции.
+            assert get_cached_user(str(user_id)) is not None
+        finally:
+            invalidate_user(user_id)